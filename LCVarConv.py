@@ -2,38 +2,281 @@
 
 import sys
 import os
+import re
+import mmap
+import stat
+import shutil
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
-def convert_chr_format(input_file, output_file):
+try:
+    # Optional compiled kernel, built with: cythonize -i _chrconv.pyx
+    from _chrconv import convert_stream as _c_convert_stream
+except ImportError:
+    _c_convert_stream = None
+
+# Human chromosome names, roughly in order of how many variants they carry
+_CHR_NAMES = [str(i).encode() for i in range(1, 23)] + [b'X', b'Y', b'MT', b'M']
+
+# Bare chromosome names. The literal alternatives let the regex engine dispatch
+# on the first byte; any other all-digit name is still caught by the trailing \d+.
+_CHR_TOKENS = b'|'.join(_CHR_NAMES) + rb'|\d+'
+
+# A record start is matched through the newline ending the previous record, so
+# the engine can jump from record to record with a literal search instead of
+# trying a (?m)^ anchor at every byte. Only the first record of a buffer has no
+# newline in front of it and is checked once with the \A-anchored pattern.
+_CHR_RE = re.compile(rb'\n(' + _CHR_TOKENS + rb')\t')
+_CHR_FIRST_RE = re.compile(rb'\A(' + _CHR_TOKENS + rb')\t')
+
+# Precomputed replacements for the usual chromosome tokens (newline and tab included)
+_CHR_MAP = {b'\n' + name + b'\t': b'\nchr' + name + b'\t' for name in _CHR_NAMES}
+
+# Read size for inputs that cannot be memory-mapped
+_BLOCK_SIZE = 4 << 20
+
+def _chr_repl(match):
+    """Replacement for a matched chromosome token: one dict lookup in the common case"""
+    token = match[0]
+    return _CHR_MAP.get(token) or b'\nchr' + token[1:]
+
+def _rewrite(buf, outfile):
+    """
+    Write the converted form of buf (bytes or mmap, starting on a record
+    boundary) to outfile
+    """
+    first = _CHR_FIRST_RE.match(buf)
+    if first is None:
+        outfile.write(_CHR_RE.sub(_chr_repl, buf))
+        return
+    outfile.write(b'chr' + first[0])
+    with memoryview(buf) as view:
+        outfile.write(_CHR_RE.sub(_chr_repl, view[first.end():]))
+
+def _fileno(f):
+    """Return the file descriptor behind a file object, or None (e.g. io.BytesIO)"""
+    try:
+        return f.fileno()
+    except (AttributeError, OSError):
+        return None
+
+def _is_regular(fd):
+    """Report whether a descriptor refers to a regular file (not a pipe or terminal)"""
+    return stat.S_ISREG(os.fstat(fd).st_mode)
+
+def _advise_sequential(fd):
+    """
+    Tell the kernel a regular file will be read front to back, so it reads
+    ahead more aggressively on cold caches. Only a hint: ignored where unsupported.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def _has_chr_prefix(fd):
+    """
+    Peek at the first record after the header and report whether it already
+    uses chr names. Uses pread so the read position of the file is untouched.
+    """
+    head = os.pread(fd, 1 << 16, 0)
+    if head.startswith(b'#'):
+        head = head[head.find(b'\n') + 1:]
+    return head.startswith(b'chr')
+
+def _is_converted(fd):
+    """
+    Report whether no record of a regular file holds a bare chromosome name, so
+    the file can be copied as is. The first record is peeked at cheaply; only if
+    it already uses chr names is the whole file searched, since a file merged
+    from several sources can still hold bare names further down. The search
+    reads the mapped file without building any output.
+    """
+    if not _has_chr_prefix(fd):
+        return False
+    try:
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return False
+    with mm:
+        if hasattr(mm, 'madvise'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        return _CHR_FIRST_RE.match(mm) is None and _CHR_RE.search(mm) is None
+
+def _copy_file(infile, outfile):
+    """
+    Copy a regular file unchanged, in the kernel on Linux. Elsewhere os.sendfile
+    may only write to sockets (macOS), so the copy goes through user space.
+    """
+    out_fd = _fileno(outfile)
+    if out_fd is None or not sys.platform.startswith('linux'):
+        shutil.copyfileobj(infile, outfile, _BLOCK_SIZE)
+        return
+    outfile.flush()
+    in_fd = infile.fileno()
+    offset, size = 0, os.fstat(in_fd).st_size
+    while offset < size:
+        sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+        if not sent:
+            break
+        offset += sent
+
+def _convert_blocks(infile, outfile):
+    """
+    Rewrite a binary stream in large blocks, carrying any partial last line
+    over to the next block so a record is never split across two substitutions.
+    """
+    carry = b''
+    while True:
+        block = infile.read(_BLOCK_SIZE)
+        if not block:
+            break
+        if carry:
+            block = carry + block
+        end = block.rfind(b'\n') + 1
+        carry = block[end:]
+        _rewrite(block[:end], outfile)
+    if carry:
+        _rewrite(carry, outfile)
+
+def _split_ranges(input_file, size, jobs):
+    """
+    Split a file into at most `jobs` byte ranges, each starting at a line boundary
+    """
+    bounds = [0]
+    with open(input_file, 'rb') as infile:
+        for i in range(1, jobs):
+            pos = max(size * i // jobs, bounds[-1])
+            if pos >= size:
+                break
+            # Move forward to the start of the next line
+            infile.seek(pos - 1 if pos else 0)
+            infile.readline()
+            bounds.append(infile.tell())
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+def _convert_range(input_file, start, end, shard_file):
+    """
+    Rewrite one line-aligned byte range of the input into its own shard file
+    """
+    with open(input_file, 'rb') as infile, \
+         mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+         open(shard_file, 'wb') as shard:
+        if hasattr(mm, 'madvise'):
+            # madvise wants a page-aligned start
+            page_start = start - start % mmap.PAGESIZE
+            mm.madvise(mmap.MADV_SEQUENTIAL, page_start, end - page_start)
+        _rewrite(mm[start:end], shard)
+
+def _convert_parallel(input_file, outfile, size, jobs):
+    """
+    Rewrite a large file by converting line-aligned ranges in a process pool
+    and concatenating the shards in order. Records are independent, so the
+    header in the first range needs no special handling.
+    """
+    ranges = _split_ranges(input_file, size, jobs)
+    # Keep shards next to the output when it is a real file
+    out_name = getattr(outfile, 'name', None)
+    shard_dir = None
+    if isinstance(out_name, str) and os.path.isfile(out_name):
+        shard_dir = os.path.dirname(os.path.abspath(out_name))
+    with tempfile.TemporaryDirectory(dir=shard_dir) as tmp_dir:
+        shard_files = [os.path.join(tmp_dir, f"shard_{i}") for i in range(len(ranges))]
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(_convert_range, input_file, start, end, shard_file)
+                       for (start, end), shard_file in zip(ranges, shard_files)]
+            for future in futures:
+                future.result()
+
+        for shard_file in shard_files:
+            with open(shard_file, 'rb') as shard:
+                shutil.copyfileobj(shard, outfile, _BLOCK_SIZE)
+
+def convert_stream(infile, outfile, jobs=1):
+    """
+    Convert chromosome names from one open binary file object to another.
+
+    Both objects must still be at their start. Anything with read()/write()
+    works (e.g. io.BytesIO, or a subprocess's stdout), so the conversion can
+    be chained in a pipeline without an intermediate file. Faster paths are
+    taken whenever real file descriptors are available:
+      - files in which every record already carries a chr prefix are copied as is
+      - with jobs > 1, large regular files are split into line-aligned ranges
+        that are converted in parallel worker processes
+      - otherwise the compiled _chrconv kernel streams the rewrite
+      - otherwise a regular input is memory-mapped and rewritten in one pass
+    Everything else goes through the pure-Python block rewrite.
+    """
+    in_fd, out_fd = _fileno(infile), _fileno(outfile)
+    regular = in_fd is not None and _is_regular(in_fd)
+
+    if regular and _is_converted(in_fd):
+        _copy_file(infile, outfile)
+        return
+
+    if regular:
+        _advise_sequential(in_fd)
+
+    input_name = getattr(infile, 'name', None)
+    if jobs > 1 and regular and isinstance(input_name, str):
+        size = os.fstat(in_fd).st_size
+        # Keep every worker busy with at least one full block
+        jobs = min(jobs, size // _BLOCK_SIZE + 1)
+        if jobs > 1:
+            _convert_parallel(input_name, outfile, size, jobs)
+            return
+
+    # The compiled kernel streams the rewrite in C with constant memory
+    if _c_convert_stream is not None and in_fd is not None and out_fd is not None:
+        outfile.flush()
+        _c_convert_stream(in_fd, out_fd)
+        return
+
+    # Otherwise map the whole file and let the regex engine rewrite it in one pass.
+    # The '#Chr' header never matches the pattern, so it is passed through as is.
+    mm = None
+    if regular:
+        try:
+            mm = mmap.mmap(in_fd, 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files cannot be mapped
+            pass
+
+    if mm is not None:
+        with mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            _rewrite(mm, outfile)
+        return
+
+    _convert_blocks(infile, outfile)
+
+def convert_chr_format(input_file, output_file, jobs=1):
     """
     Convert chromosome names from numeric (1,2,3...) to chr format (chr1,chr2,chr3...)
     in InterVar output files.
     """
-    with open(input_file, 'r') as infile, open(output_file, 'w') as outfile:
-        for line in infile:
-            if line.startswith('#Chr'):
-                # Header line
-                outfile.write(line)
-                continue
-                
-            fields = line.split('\t')
-            # Check if the chromosome field is numeric and doesn't already have 'chr' prefix
-            if fields[0].isdigit() or fields[0] in ['X', 'Y', 'M', 'MT']:
-                fields[0] = f"chr{fields[0]}"
-            
-            # Write the modified line
-            outfile.write('\t'.join(fields))
+    with open(input_file, 'rb') as infile, open(output_file, 'wb') as outfile:
+        convert_stream(infile, outfile, jobs)
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print(f"Usage: {os.path.basename(sys.argv[0])} input_file output_file")
-        sys.exit(1)
-        
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
-    
-    if not os.path.exists(input_file):
-        print(f"Error: Input file '{input_file}' does not exist.")
-        sys.exit(1)
-    
-    convert_chr_format(input_file, output_file)
-    print(f"Conversion complete: {input_file} → {output_file}")
+    parser = argparse.ArgumentParser(
+        description='Convert chromosome names in InterVar output files to chr format')
+    parser.add_argument('input_file', type=argparse.FileType('rb'),
+                        help="InterVar output file ('-' for stdin)")
+    parser.add_argument('output_file', type=argparse.FileType('wb'),
+                        help="Converted output file ('-' for stdout)")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of worker processes for large files (default: 1)')
+    args = parser.parse_args()
+
+    infile = args.input_file
+    outfile = args.output_file
+
+    convert_stream(infile, outfile, args.jobs)
+    outfile.flush()
+    if outfile is not sys.stdout.buffer:
+        print(f"Conversion complete: {infile.name} → {outfile.name}")
@@ -1,146 +1,73 @@
 #!/usr/bin/env python3
 import sys
 import os
+import re
+import mmap
 import json
+import zlib
+import base64
 import csv
+import io
 from datetime import datetime
+from collections import defaultdict
+from operator import itemgetter
+from urllib.parse import quote
 
-def read_tsv_file(file_path):
-    """Read TSV file and return headers and data rows"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f, delimiter='\t')
-        headers = next(reader)  # Get the first row as headers
-        rows = []
-        for i, row in enumerate(reader):
-            if row and len(row) >= len(headers):  # Skip empty or invalid rows
-                # Create a dictionary for each row
-                variant = {headers[j]: row[j] if j < len(row) else '' for j in range(len(headers))}
-                # Add rank based on position
-                variant['rank'] = i + 1
-                rows.append(variant)
-    return headers, rows
+try:
+    # Optional C JSON encoder, several times faster than the json module
+    import orjson
 
-def read_coverage_metrics(file_path):
-    """Read coverage metrics file and extract key values"""
-    metrics = {}
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-            # Extract sample ID from the first line
-            first_line = content.split('\n')[0]
-            sample_id = first_line.split(':')[-1].strip() if ':' in first_line else "Unknown"
-            metrics['sample_id'] = sample_id
-            
-            # Extract metrics using simple parsing
-            raw_reads = extract_metric(content, 'Raw reads: ')
-            trimmed_reads = extract_metric(content, 'Trimmed reads: ')
-            
-            # Remove "(total from R1 and R2)" from raw and trimmed reads
-            metrics['raw_reads'] = raw_reads.replace("(total from R1 and R2)", "").strip()
-            metrics['trimmed_reads'] = trimmed_reads.replace("(total from R1 and R2)", "").strip()
-            
-            metrics['mean_read_length'] = extract_metric(content, 'Mean read length: ')
-            metrics['uniquely_mapped_reads'] = extract_metric(content, 'Uniquely mapped reads: ').split(' ')[0]
-            metrics['duplicate_reads'] = extract_metric(content, 'Duplicate reads: ').split(' ')[0]
-            metrics['average_coverage'] = extract_metric(content, 'Average coverage: ')
-            metrics['bases_10x'] = extract_metric(content, 'Percentage of bases with ≥10X coverage: ')
-            metrics['bases_30x'] = extract_metric(content, 'Percentage of bases with ≥30X coverage: ')
-            metrics['bases_50x'] = extract_metric(content, 'Percentage of bases with ≥50X coverage: ')
-            metrics['bases_100x'] = extract_metric(content, 'Percentage of bases with ≥100X coverage: ')
-            metrics['bases_200x'] = extract_metric(content, 'Percentage of bases with ≥200X coverage: ')
-            metrics['bases_300x'] = extract_metric(content, 'Percentage of bases with ≥300X coverage: ')
-    except Exception as e:
-        print(f"Warning: Could not read coverage metrics file: {e}")
-        # Set default values
-        metrics = {
-            'sample_id': "Unknown",
-            'raw_reads': "N/A",
-            'trimmed_reads': "N/A",
-            'mean_read_length': "N/A",
-            'uniquely_mapped_reads': "N/A",
-            'duplicate_reads': "N/A",
-            'average_coverage': "N/A",
-            'bases_10x': "N/A",
-            'bases_30x': "N/A",
-            'bases_50x': "N/A",
-            'bases_100x': "N/A",
-            'bases_200x': "N/A",
-            'bases_300x': "N/A"
-        }
-    return metrics
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':'))
 
-def extract_metric(content, prefix):
-    """Helper function to extract a metric value from the content"""
-    try:
-        for line in content.split('\n'):
-            if prefix in line:
-                return line.split(prefix)[1].strip()
-    except:
-        pass
-    return "N/A"
+try:
+    # Optional multi-threaded CSV parser, used for the variants TSV when installed
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa_csv = None
 
-def generate_html(file_path, output_path=None, coverage_metrics_path=None):
-    """Generate HTML report from TSV file"""
-    # Determine output filename if not specified
-    if not output_path:
-        output_path = os.path.splitext(file_path)[0] + "_report.html"
-    
-    # Get the sample name from the file path
-    full_filename = os.path.basename(os.path.splitext(file_path)[0])
-    sample_name = full_filename.split('_variants')[0]
-    
-    # Read the TSV file
-    try:
-        headers, variants = read_tsv_file(file_path)
-    except Exception as e:
-        print(f"Error reading TSV file: {e}")
-        return False
-    
-    # Read coverage metrics if available
-    coverage_metrics = {}
-    if coverage_metrics_path and os.path.exists(coverage_metrics_path):
-        coverage_metrics = read_coverage_metrics(coverage_metrics_path)
-    else:
-        # Try to find a coverage metrics file with standard naming
-        potential_metrics_file = f"{sample_name}_coverage_metrics.txt"
-        if os.path.exists(potential_metrics_file):
-            coverage_metrics = read_coverage_metrics(potential_metrics_file)
-        else:
-            print(f"Warning: Coverage metrics file not found. Using default values.")
-            coverage_metrics = {
-                'sample_id': sample_name,
-                'raw_reads': "N/A",
-                'trimmed_reads': "N/A",
-                'mean_read_length': "N/A",
-                'uniquely_mapped_reads': "N/A",
-                'duplicate_reads': "N/A",
-                'average_coverage': "N/A",
-                'bases_10x': "N/A",
-                'bases_30x': "N/A",
-                'bases_50x': "N/A",
-                'bases_100x': "N/A",
-                'bases_200x': "N/A",
-                'bases_300x': "N/A"
-            }
-    
-    # Convert data to JSON for embedding in HTML
-    variants_json = json.dumps(variants)
-    
-    # Current date for the report
-    current_date = datetime.now().strftime("%B %d, %Y")
-    
-    # Generate HTML content with embedded data
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Genetic Variant Analysis Report</title>
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css" rel="stylesheet">
-    <style>
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    # Without pyarrow or pandas the TSV is read with the csv module
+    pd = None
+
+# "Name: value" lines of the coverage metrics file that are shown in the report
+# (a bytes pattern, so it can run directly over the memory-mapped file)
+_METRIC_RE = re.compile(r'^[ \t]*(Raw reads|Trimmed reads|Mean read length|Uniquely mapped reads|'
+                        r'Duplicate reads|Average coverage|'
+                        r'Percentage of bases with ≥(?:10|30|50|100|200|300)X coverage): (.*)$'
+                        .encode('utf-8'), re.MULTILINE)
+
+# Chromosome columns of the TSV, in the order they are tried
+_CHROM_KEYS = ('#Chr', 'Chr', 'chr', 'CHROM', '#CHROM', 'chromosome')
+
+# Used to clean up effect and ACMG rules text (\b is ASCII-only, as in JavaScript)
+_VARIANT_WORD_RE = re.compile(r'\bvariant\b', re.IGNORECASE | re.ASCII)
+_SPACES_RE = re.compile(r'\s+')
+
+# Badge classes of the standard ACMG classifications (lower-cased)
+_ACMG_BADGE_CLASSES = {
+    'pathogenic': 'badge-pathogenic',
+    'likely pathogenic': 'badge-likely-pathogenic',
+    'vus h': 'badge-vus-h',
+    'vus m': 'badge-vus',
+    'vus c': 'badge-vus-c',
+    'uncertain significance': 'badge-vus',
+    'likely benign': 'badge-likely-benign',
+    'benign': 'badge-benign',
+}
+
+# Stylesheet of the report. Kept out of the generate_html f-string so its
+# braces need no escaping and it is built once at import.
+_REPORT_CSS = """\
         /* Color Palette */
-        :root {{
+        :root {
             /* Primary Colors */
             --deep-blue: #06274b;
             --teal: #2CA6A4;
@@ -171,29 +98,29 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             --vus-h-end: #D2691E; /* Orange-red end for VUS H */
             --vus-c-end: #87CEEB; /* Light sky blue end for VUS C (more distinguishable) */
             --benign-color: #4CAF50;
-        }}
+        }
         
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        }}
+        }
         
-        body {{
+        body {
             background-color: var(--soft-gray);
             color: var(--dark-text);
             line-height: 1.6;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 100%;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
         
         /* Header Styles - REDUCED BY 15% */
-        .report-header {{
+        .report-header {
             background-color: var(--deep-blue);
             color: var(--white-bg);
             padding: 8.5px 12px;
@@ -207,175 +134,176 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             margin-left: 0;
             margin-right: auto;
             height: 45px;
-        }}
+        }
         
-        .logo img {{
+        .logo img {
             height: 29px;
             width: auto;
-        }}
+        }
         
         /* Info Card */
-        .info-card {{
+        .info-card {
             background-color: var(--light-teal);
             border-left: 4px solid var(--teal);
             padding: 10px 15px;
             margin-bottom: 20px;
             border-radius: 4px;
-        }}
+        }
         
-        .info-card h3 {{
+        .info-card h3 {
             color: var(--deep-blue);
             margin-bottom: 8px;
             font-size: 16px;
-        }}
+        }
         
-        .info-details {{
+        .info-details {
             display: flex;
             flex-direction: column;
             gap: 6px;
-        }}
+        }
         
-        .info-item {{
+        .info-item {
             display: flex;
             align-items: flex-start;
             gap: 6px;
-        }}
+        }
         
-        .info-icon {{
+        .info-icon {
             color: var(--teal);
             width: 16px;
             text-align: center;
             font-size: 12px;
             margin-top: 3px;
-        }}
+        }
         
-        .info-text {{
+        .info-text {
             font-size: 13px;
             color: var(--dark-text);
             line-height: 1.4;
-        }}
+        }
         
         /* Coverage Metrics Section - REDUCED BY 50% */
-        .coverage-section {{
+        .coverage-section {
             background-color: var(--white-bg);
             padding: 10px;
             border-radius: 10px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             margin-bottom: 15px;
-        }}
+        }
         
-        .coverage-header {{
+        .coverage-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 8px;
             border-bottom: 1px solid var(--light-border);
             padding-bottom: 5px;
-        }}
+        }
         
-        .coverage-header h3 {{
+        .coverage-header h3 {
             color: var(--deep-blue);
             font-size: 14px;
             display: flex;
             align-items: center;
             gap: 5px;
-        }}
+        }
         
-        .coverage-metrics-grid {{
+        .coverage-metrics-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 8px;
-        }}
+        }
         
-        .metrics-card {{
+        .metrics-card {
             background-color: var(--soft-gray);
             border-radius: 8px;
             padding: 8px;
             box-shadow: 0 1px 2px rgba(0,0,0,0.05);
             transition: transform 0.2s, box-shadow 0.2s;
             height: 55px;
-        }}
+        }
         
-        .metrics-card:hover {{
+        .metrics-card:hover {
             transform: translateY(-2px);
             box-shadow: 0 3px 6px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .metrics-title {{
+        .metrics-title {
             font-size: 11px;
             color: var(--medium-gray);
             margin-bottom: 3px;
             display: flex;
             align-items: center;
             gap: 5px;
-        }}
+        }
         
-        .metrics-title i {{
+        .metrics-title i {
             color: var(--lime);
-        }}
+        }
         
-        .metrics-value {{
+        .metrics-value {
             font-size: 15px;
             font-weight: 600;
             color: var(--deep-blue);
-        }}
+        }
         
-        .coverage-distribution {{
+        .coverage-distribution {
             margin-top: 10px;
-        }}
+        }
         
-        .coverage-distribution h4 {{
+        .coverage-distribution h4 {
             color: var(--deep-blue);
             font-size: 12px;
             margin-bottom: 8px;
             display: flex;
             align-items: center;
             gap: 5px;
-        }}
+        }
         
-        .coverage-bars {{
+        .coverage-bars {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
             gap: 8px;
-        }}
+        }
         
-        .coverage-item {{
+        .coverage-item {
             margin-bottom: 3px;
-        }}
+        }
         
-        .coverage-label {{
+        .coverage-label {
             display: flex;
             justify-content: space-between;
             margin-bottom: 2px;
             font-size: 11px;
-        }}
+        }
         
-        .coverage-label-text {{
+        .coverage-label-text {
             color: var(--deep-blue);
             font-weight: 500;
-        }}
+        }
         
-        .coverage-percent {{
+        .coverage-percent {
             color: var(--teal);
             font-weight: 700;
-        }}
+        }
         
-        .coverage-bar-bg {{
+        .coverage-bar-bg {
             width: 100%;
             height: 5px;
             background-color: var(--soft-gray);
             border-radius: 3px;
             overflow: hidden;
-        }}
+        }
         
-        .coverage-bar-fill {{
+        .coverage-bar-fill {
+            width: var(--w, 0%);
             height: 100%;
             background: linear-gradient(90deg, var(--teal) 0%, #249391 100%);
             border-radius: 3px;
-        }}
+        }
         
         /* Controls */
-        .controls {{
+        .controls {
             background-color: var(--white-bg);
             padding: 20px;
             border-radius: 10px;
@@ -383,24 +311,24 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             margin-bottom: 20px;
             display: flex;
             flex-direction: column;
-        }}
+        }
         
-        .search-controls {{
+        .search-controls {
             display: flex;
             gap: 15px;
             align-items: center;
             margin-bottom: 15px;
-        }}
+        }
         
-        .search-box {{
+        .search-box {
             flex-grow: 1;
             padding: 10px 15px;
             border: 1px solid var(--light-border);
             border-radius: 4px;
             font-size: 14px;
-        }}
+        }
         
-        .refresh-button {{
+        .refresh-button {
             display: inline-flex;
             align-items: center;
             gap: 5px;
@@ -413,14 +341,14 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             font-size: 14px;
             transition: background-color 0.2s;
             white-space: nowrap;
-        }}
+        }
         
-        .refresh-button:hover {{
+        .refresh-button:hover {
             background-color: #249391;
-        }}
+        }
         
         /* VarSome-style pagination controls */
-        .pagination-controls {{
+        .pagination-controls {
             display: flex;
             justify-content: space-between;
             align-items: center;
@@ -429,41 +357,41 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             border-radius: 10px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             margin-bottom: 20px;
-        }}
+        }
         
-        .results-per-page {{
+        .results-per-page {
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
         
-        .results-per-page label {{
+        .results-per-page label {
             font-size: 14px;
             color: var(--dark-text);
             font-weight: 500;
-        }}
+        }
         
-        .results-per-page select {{
+        .results-per-page select {
             padding: 8px 12px;
             border: 1px solid var(--light-border);
             border-radius: 4px;
             font-size: 14px;
             background-color: var(--white-bg);
             cursor: pointer;
-        }}
+        }
         
-        .page-info {{
+        .page-info {
             font-size: 14px;
             color: var(--medium-gray);
-        }}
+        }
         
-        .page-navigation {{
+        .page-navigation {
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
         
-        .page-nav-btn {{
+        .page-nav-btn {
             background-color: var(--white-bg);
             border: 1px solid var(--light-border);
             color: var(--deep-blue);
@@ -472,25 +400,25 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             border-radius: 4px;
             transition: all 0.2s;
             font-size: 14px;
-        }}
+        }
         
-        .page-nav-btn:hover:not(:disabled) {{
+        .page-nav-btn:hover:not(:disabled) {
             background-color: var(--light-teal);
-        }}
+        }
         
-        .page-nav-btn:disabled {{
+        .page-nav-btn:disabled {
             opacity: 0.5;
             cursor: not-allowed;
-        }}
+        }
         
-        .page-nav-btn.active {{
+        .page-nav-btn.active {
             background-color: var(--teal);
             color: var(--white-bg);
             border-color: var(--teal);
-        }}
+        }
         
         /* Enhanced Variants Table Container */
-        .variants-container {{
+        .variants-container {
             background-color: var(--white-bg);
             border-radius: 10px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
@@ -498,20 +426,20 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             position: relative;
             overflow-x: auto;
             overflow-y: visible;
-        }}
+        }
         
         /* Enhanced Table Layout for Excel-like Column Resizing */
-        .variants-table {{
+        .variants-table {
             width: 100%;
             border-collapse: separate;
             border-spacing: 0;
             font-size: 14px;
             table-layout: fixed;
             min-width: 100%;
-        }}
+        }
         
         .variants-table th,
-        .variants-table td {{
+        .variants-table td {
             padding: 12px 8px;
             text-align: left;
             position: relative;
@@ -521,19 +449,19 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             text-overflow: ellipsis;
             white-space: nowrap;
             box-sizing: border-box;
-        }}
+        }
         
         .variants-table th:last-child,
-        .variants-table td:last-child {{
+        .variants-table td:last-child {
             border-right: none;
-        }}
+        }
         
-        .variants-table tbody tr:last-child td {{
+        .variants-table tbody tr:last-child td {
             border-bottom: none;
-        }}
+        }
         
         /* Enhanced Table Headers */
-        .variants-table th {{
+        .variants-table th {
             background: linear-gradient(180deg, var(--deep-blue) 0%, #2C5282 100%);
             color: var(--white-bg);
             font-weight: 600;
@@ -547,14 +475,14 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             letter-spacing: 0.5px;
             user-select: none;
             border-bottom: 2px solid var(--deep-blue);
-        }}
+        }
         
-        .variants-table th:hover {{
+        .variants-table th:hover {
             background: linear-gradient(180deg, #2C5282 0%, #1A365D 100%);
-        }}
+        }
         
         /* Enhanced Column Resizer */
-        .column-resizer {{
+        .column-resizer {
             position: absolute;
             top: 0;
             right: -3px;
@@ -565,29 +493,29 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             background: transparent;
             border-radius: 3px;
             transition: background-color 0.2s ease;
-        }}
+        }
         
-        .column-resizer:hover {{
+        .column-resizer:hover {
             background: rgba(44, 166, 164, 0.3);
-        }}
+        }
         
-        .column-resizer:active {{
+        .column-resizer:active {
             background: rgba(44, 166, 164, 0.6);
-        }}
+        }
         
         /* Enhanced Resizing States */
-        .resizing {{
+        .resizing {
             cursor: col-resize !important;
             user-select: none !important;
-        }}
+        }
         
-        .resizing * {{
+        .resizing * {
             cursor: col-resize !important;
             user-select: none !important;
-        }}
+        }
         
         /* Enhanced Resize Line */
-        .resize-line {{
+        .resize-line {
             position: fixed;
             width: 2px;
             background: var(--teal);
@@ -595,44 +523,44 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             pointer-events: none;
             display: none;
             box-shadow: 0 0 4px rgba(44, 166, 164, 0.5);
-        }}
+        }
         
-        .resize-line.active {{
+        .resize-line.active {
             background: #FF6B35;
             box-shadow: 0 0 6px rgba(255, 107, 53, 0.6);
-        }}
+        }
         
         /* Enhanced Table Body Styling */
-        .variants-table tbody tr:nth-child(even) {{
+        .variants-table tbody tr:nth-child(even) {
             background-color: var(--soft-gray);
-        }}
+        }
         
-        .variants-table tbody tr:hover {{
+        .variants-table tbody tr:hover {
             background-color: rgba(44, 166, 164, 0.05);
             transition: background-color 0.15s ease;
-        }}
+        }
         
         /* Default Column Widths */
-        .col-rank {{ width: 60px; min-width: 50px; max-width: 100px; }}
-        .col-variant {{ width: 140px; min-width: 100px; max-width: 300px; }}
-        .col-variant-type {{ width: 120px; min-width: 80px; max-width: 200px; }}
-        .col-gene {{ width: 80px; min-width: 60px; max-width: 150px; }}
-        .col-rs {{ width: 100px; min-width: 80px; max-width: 200px; }}
-        .col-acmg {{ width: 120px; min-width: 100px; max-width: 200px; }}
-        .col-acmg-rules {{ width: 160px; min-width: 120px; max-width: 300px; }}
-        .col-hgvs {{ width: 200px; min-width: 150px; max-width: 400px; }}
-        .col-hgvs-protein {{ width: 150px; min-width: 120px; max-width: 300px; }}
-        .col-hgvs-coding {{ width: 150px; min-width: 120px; max-width: 300px; }}
-        .col-inheritance {{ width: 100px; min-width: 80px; max-width: 150px; }}
-        .col-effect {{ width: 140px; min-width: 100px; max-width: 250px; }}
-        .col-zygosity {{ width: 100px; min-width: 80px; max-width: 150px; }}
-        .col-gnomad {{ width: 100px; min-width: 80px; max-width: 150px; }}
-        .col-allelic-balance {{ width: 120px; min-width: 100px; max-width: 180px; }}
-        .col-depth {{ width: 80px; min-width: 60px; max-width: 120px; }}
-        .col-filter {{ width: 80px; min-width: 60px; max-width: 120px; }}
+        .col-rank { width: 60px; min-width: 50px; max-width: 100px; }
+        .col-variant { width: 140px; min-width: 100px; max-width: 300px; }
+        .col-variant-type { width: 120px; min-width: 80px; max-width: 200px; }
+        .col-gene { width: 80px; min-width: 60px; max-width: 150px; }
+        .col-rs { width: 100px; min-width: 80px; max-width: 200px; }
+        .col-acmg { width: 120px; min-width: 100px; max-width: 200px; }
+        .col-acmg-rules { width: 160px; min-width: 120px; max-width: 300px; }
+        .col-hgvs { width: 200px; min-width: 150px; max-width: 400px; }
+        .col-hgvs-protein { width: 150px; min-width: 120px; max-width: 300px; }
+        .col-hgvs-coding { width: 150px; min-width: 120px; max-width: 300px; }
+        .col-inheritance { width: 100px; min-width: 80px; max-width: 150px; }
+        .col-effect { width: 140px; min-width: 100px; max-width: 250px; }
+        .col-zygosity { width: 100px; min-width: 80px; max-width: 150px; }
+        .col-gnomad { width: 100px; min-width: 80px; max-width: 150px; }
+        .col-allelic-balance { width: 120px; min-width: 100px; max-width: 180px; }
+        .col-depth { width: 80px; min-width: 60px; max-width: 120px; }
+        .col-filter { width: 80px; min-width: 60px; max-width: 120px; }
         
         /* Rank Styling */
-        .rank-bubble {{
+        .rank-bubble {
             display: inline-flex;
             align-items: center;
             justify-content: center;
@@ -643,30 +571,30 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             border-radius: 50%;
             font-weight: bold;
             font-size: 12px;
-        }}
+        }
         
         /* Variant code styling */
-        .variant-code {{
+        .variant-code {
             font-family: 'Courier New', monospace;
             background-color: rgba(30, 58, 95, 0.1);
             padding: 2px 5px;
             border-radius: 3px;
             font-size: 12px;
-        }}
+        }
         
         /* Gene Styling */
-        .gene-link {{
+        .gene-link {
             color: var(--teal);
             text-decoration: none;
             font-weight: 600;
-        }}
+        }
         
-        .gene-link:hover {{
+        .gene-link:hover {
             text-decoration: underline;
-        }}
+        }
         
         /* Badge Styling for ACMG */
-        .badge {{
+        .badge {
             display: inline-flex;
             align-items: center;
             justify-content: center;
@@ -679,43 +607,43 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             transition: all 0.2s ease;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
             white-space: nowrap;
-        }}
+        }
         
-        .badge:hover {{
+        .badge:hover {
             transform: translateY(-1px);
             box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-        }}
+        }
         
-        .badge-pathogenic {{
+        .badge-pathogenic {
             background: linear-gradient(90deg, var(--pathogenic-red) 0%, #8b2635 100%);
-        }}
+        }
         
-        .badge-likely-pathogenic {{
+        .badge-likely-pathogenic {
             background: linear-gradient(90deg, var(--likely-pathogenic-red) 0%, var(--likely-pathogenic-end) 100%);
-        }}
+        }
         
-        .badge-vus {{
+        .badge-vus {
             background: linear-gradient(90deg, var(--vus-orange) 0%, var(--vus-m-end) 100%);
-        }}
+        }
         
-        .badge-vus-h {{
+        .badge-vus-h {
             background: linear-gradient(90deg, var(--vus-orange) 0%, var(--vus-h-end) 100%);
-        }}
+        }
         
-        .badge-vus-c {{
+        .badge-vus-c {
             background: linear-gradient(90deg, var(--vus-orange) 0%, var(--vus-c-end) 100%);
-        }}
+        }
         
-        .badge-benign, .badge-likely-benign {{
+        .badge-benign, .badge-likely-benign {
             background: linear-gradient(90deg, var(--benign-color) 0%, #059669 100%);
-        }}
+        }
         
-        .badge-other {{
+        .badge-other {
             background: linear-gradient(90deg, var(--purple) 0%, #7C3AED 100%);
-        }}
+        }
         
         /* Professional ACMG Rules Styling */
-        .acmg-rules {{
+        .acmg-rules {
             font-family: 'Courier New', monospace;
             background-color: rgba(44, 166, 164, 0.08);
             padding: 4px 8px;
@@ -725,10 +653,10 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             color: var(--deep-blue);
             letter-spacing: 0.5px;
             border: 1px solid rgba(44, 166, 164, 0.2);
-        }}
+        }
         
         /* Professional Effect Styling */
-        .effect-text {{
+        .effect-text {
             font-weight: 500;
             color: var(--dark-text);
             background-color: rgba(76, 175, 80, 0.08);
@@ -736,27 +664,27 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             border-radius: 3px;
             font-size: 13px;
             border: 1px solid rgba(76, 175, 80, 0.2);
-        }}
+        }
         
         /* Not available text */
-        .not-available {{
+        .not-available {
             color: var(--medium-gray);
             font-style: italic;
-        }}
+        }
         
         /* Filter icons */
-        .filter-pass {{
+        .filter-pass {
             color: var(--green);
             font-size: 16px;
-        }}
+        }
         
-        .filter-fail {{
+        .filter-fail {
             color: var(--red);
             font-size: 16px;
-        }}
+        }
         
         /* Footer */
-        .footer {{
+        .footer {
             background-color: var(--white-bg);
             padding: 20px;
             border-radius: 0 0 10px 10px;
@@ -765,43 +693,54 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             text-align: center;
             color: var(--medium-gray);
             font-size: 0.9rem;
-        }}
+        }
         
         /* Responsive Design */
-        @media (max-width: 1200px) {{
-            .container {{
+        @media (max-width: 1200px) {
+            .container {
                 padding: 10px;
-            }}
+            }
             
-            .coverage-metrics-grid {{
+            .coverage-metrics-grid {
                 grid-template-columns: repeat(2, 1fr);
-            }}
+            }
             
-            .coverage-bars {{
+            .coverage-bars {
                 grid-template-columns: repeat(2, 1fr);
-            }}
-        }}
+            }
+        }
         
-        @media (max-width: 768px) {{
-            .report-header {{
+        @media (max-width: 768px) {
+            .report-header {
                 width: 41%;
                 max-width: none;
-            }}
+            }
             
-            .coverage-metrics-grid {{
+            .coverage-metrics-grid {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .coverage-bars {{
+            .coverage-bars {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .pagination-controls {{
+            .pagination-controls {
                 flex-direction: column;
                 gap: 15px;
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+# Static start of the report, up to the per-sample information
+_REPORT_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Genetic Variant Analysis Report</title>
+    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css" rel="stylesheet">
+    <style>
+""" + _REPORT_CSS + """    </style>
 </head>
 <body>
     <div class="container">
@@ -815,7 +754,11 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
             </div>
         </div>
         
-        <!-- Info Card -->
+"""
+
+# Per-sample part of the report, filled in with str.format_map: the sample
+# information, coverage metrics and table markup, up to the embedded data
+_SAMPLE_HTML = """        <!-- Info Card -->
         <div class="info-card">
             <h3>Sample Information</h3>
             <div class="info-details">
@@ -848,32 +791,32 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                 <!-- Read Statistics -->
                 <div class="metrics-card">
                     <div class="metrics-title"><i class="fas fa-file-alt"></i> Raw Reads</div>
-                    <div class="metrics-value">{coverage_metrics.get('raw_reads', 'N/A')}</div>
+                    <div class="metrics-value">{raw_reads}</div>
                 </div>
                 
                 <div class="metrics-card">
                     <div class="metrics-title"><i class="fas fa-cut"></i> Trimmed Reads</div>
-                    <div class="metrics-value">{coverage_metrics.get('trimmed_reads', 'N/A')}</div>
+                    <div class="metrics-value">{trimmed_reads}</div>
                 </div>
                 
                 <div class="metrics-card">
                     <div class="metrics-title"><i class="fas fa-ruler"></i> Mean Read Length</div>
-                    <div class="metrics-value">{coverage_metrics.get('mean_read_length', 'N/A')}</div>
+                    <div class="metrics-value">{mean_read_length}</div>
                 </div>
                 
                 <div class="metrics-card">
                     <div class="metrics-title"><i class="fas fa-map-marker-alt"></i> Uniquely Mapped Reads</div>
-                    <div class="metrics-value">{coverage_metrics.get('uniquely_mapped_reads', 'N/A')}</div>
+                    <div class="metrics-value">{uniquely_mapped_reads}</div>
                 </div>
                 
                 <div class="metrics-card">
                     <div class="metrics-title"><i class="fas fa-copy"></i> Duplicate Reads</div>
-                    <div class="metrics-value">{coverage_metrics.get('duplicate_reads', 'N/A')}</div>
+                    <div class="metrics-value">{duplicate_reads}</div>
                 </div>
                 
                 <div class="metrics-card">
                     <div class="metrics-title"><i class="fas fa-layer-group"></i> Average Coverage</div>
-                    <div class="metrics-value">{coverage_metrics.get('average_coverage', 'N/A')}</div>
+                    <div class="metrics-value">{average_coverage}</div>
                 </div>
             </div>
             
@@ -886,10 +829,10 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                     <div class="coverage-item">
                         <div class="coverage-label">
                             <span class="coverage-label-text">≥10X Coverage</span>
-                            <span class="coverage-percent">{coverage_metrics.get('bases_10x', 'N/A')}</span>
+                            <span class="coverage-percent">{bases_10x}</span>
                         </div>
                         <div class="coverage-bar-bg">
-                            <div class="coverage-bar-fill" style="width: {coverage_metrics.get('bases_10x', '0%').replace('%', '')}%"></div>
+                            <div class="coverage-bar-fill" style="--w: {bases_10x_width}%"></div>
                         </div>
                     </div>
                     
@@ -897,10 +840,10 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                     <div class="coverage-item">
                         <div class="coverage-label">
                             <span class="coverage-label-text">≥30X Coverage</span>
-                            <span class="coverage-percent">{coverage_metrics.get('bases_30x', 'N/A')}</span>
+                            <span class="coverage-percent">{bases_30x}</span>
                         </div>
                         <div class="coverage-bar-bg">
-                            <div class="coverage-bar-fill" style="width: {coverage_metrics.get('bases_30x', '0%').replace('%', '')}%"></div>
+                            <div class="coverage-bar-fill" style="--w: {bases_30x_width}%"></div>
                         </div>
                     </div>
                     
@@ -908,10 +851,10 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                     <div class="coverage-item">
                         <div class="coverage-label">
                             <span class="coverage-label-text">≥50X Coverage</span>
-                            <span class="coverage-percent">{coverage_metrics.get('bases_50x', 'N/A')}</span>
+                            <span class="coverage-percent">{bases_50x}</span>
                         </div>
                         <div class="coverage-bar-bg">
-                            <div class="coverage-bar-fill" style="width: {coverage_metrics.get('bases_50x', '0%').replace('%', '')}%"></div>
+                            <div class="coverage-bar-fill" style="--w: {bases_50x_width}%"></div>
                         </div>
                     </div>
                     
@@ -919,10 +862,10 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                     <div class="coverage-item">
                         <div class="coverage-label">
                             <span class="coverage-label-text">≥100X Coverage</span>
-                            <span class="coverage-percent">{coverage_metrics.get('bases_100x', 'N/A')}</span>
+                            <span class="coverage-percent">{bases_100x}</span>
                         </div>
                         <div class="coverage-bar-bg">
-                            <div class="coverage-bar-fill" style="width: {coverage_metrics.get('bases_100x', '0%').replace('%', '')}%"></div>
+                            <div class="coverage-bar-fill" style="--w: {bases_100x_width}%"></div>
                         </div>
                     </div>
                     
@@ -930,10 +873,10 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                     <div class="coverage-item">
                         <div class="coverage-label">
                             <span class="coverage-label-text">≥200X Coverage</span>
-                            <span class="coverage-percent">{coverage_metrics.get('bases_200x', 'N/A')}</span>
+                            <span class="coverage-percent">{bases_200x}</span>
                         </div>
                         <div class="coverage-bar-bg">
-                            <div class="coverage-bar-fill" style="width: {coverage_metrics.get('bases_200x', '0%').replace('%', '')}%"></div>
+                            <div class="coverage-bar-fill" style="--w: {bases_200x_width}%"></div>
                         </div>
                     </div>
                     
@@ -941,10 +884,10 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                     <div class="coverage-item">
                         <div class="coverage-label">
                             <span class="coverage-label-text">≥300X Coverage</span>
-                            <span class="coverage-percent">{coverage_metrics.get('bases_300x', 'N/A')}</span>
+                            <span class="coverage-percent">{bases_300x}</span>
                         </div>
                         <div class="coverage-bar-bg">
-                            <div class="coverage-bar-fill" style="width: {coverage_metrics.get('bases_300x', '0%').replace('%', '')}%"></div>
+                            <div class="coverage-bar-fill" style="--w: {bases_300x_width}%"></div>
                         </div>
                     </div>
                 </div>
@@ -1021,19 +964,102 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
     <script>
         // Store the sample name
         const sampleName = "{sample_name}";
+    </script>
+"""
+
+# Script defining the variant data from the TSV file, around the output of
+# write_variants_json. Embedded in the report, or written next to it as a
+# separate .js file for large reports.
+_DATA_SCRIPT_START = """        // Variant data from TSV file, in blocks of variantBlockSize variants that are
+        // inflated separately. Each block is base64 of gzip-compressed JSON: one array
+        // per report field, holding that field of each variant in the block (or its
+        // distinct values plus one index per variant).
+"""
+
+# Variants per block of the embedded data. The report inflates the first block
+# to show the first page; blocks are compressed separately, which costs a few
+# percent of size compared to one stream.
+_DATA_BLOCK_SIZE = 4096
+
+# Static end of the report, written after the variant data: the script that
+# decodes the data and renders the table
+_REPORT_SCRIPT = """    <script>
+        // Inflate one block of variant data with the browser's native gzip decoder
+        async function inflateBlock(blockGz) {
+            const binary = atob(blockGz);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) {
+                bytes[i] = binary.charCodeAt(i);
+            }
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            const data = JSON.parse(await new Response(stream).text());
+            
+            // Expand dictionary-encoded columns to one value per variant
+            for (const [name, column] of Object.entries(data)) {
+                if (!Array.isArray(column)) {
+                    data[name] = column.codes.map(code => column.values[code]);
+                }
+            }
+            return data;
+        }
         
-        // Embedded variant data from TSV file
-        const allVariants = {variants_json};
-        
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', async function() {
+            // Display-ready fields, column by column: V.gene[i] is the gene of variant i.
+            // Blocks are copied in as they are inflated. Only the first one is needed
+            // for the first page; the rest follow in the background, or as soon as a
+            // page shows one of their variants.
+            const V = {};
+            const blockReady = new Uint8Array(variantBlocksGz.length);
+            const blockLoads = [];
+            let allBlocksLoad = null;
+            
+            function loadBlock(b) {
+                if (!blockLoads[b]) {
+                    blockLoads[b] = inflateBlock(variantBlocksGz[b]).then(block => {
+                        const offset = b * variantBlockSize;
+                        for (const [name, values] of Object.entries(block)) {
+                            const column = V[name] || (V[name] = new Array(variantCount));
+                            for (let k = 0; k < values.length; k++) {
+                                column[offset + k] = values[k];
+                            }
+                        }
+                        blockReady[b] = 1;
+                    });
+                }
+                return blockLoads[b];
+            }
+            
+            function loadAllBlocks() {
+                if (!allBlocksLoad) {
+                    allBlocksLoad = Promise.all(variantBlocksGz.map((blockGz, b) => loadBlock(b)));
+                }
+                return allBlocksLoad;
+            }
+            
+            await loadBlock(0);
+            
             // Initialize variables
-            let filteredVariants = [...allVariants];
+            // Variants are referred to by their position in V. The ones passing
+            // the search fill the first filteredCount slots of a buffer allocated once.
+            const filteredIndices = new Int32Array(variantCount);
+            let filteredCount = 0;
+            
+            function showAllVariants() {
+                for (let i = 0; i < variantCount; i++) {
+                    filteredIndices[i] = i;
+                }
+                filteredCount = variantCount;
+            }
+            showAllVariants();
             let currentPage = 1;
             let rowsPerPage = 10; // Default to 10 as per VarSome style
-            let originalVariants = [...allVariants];
+            
+            // Table rows reused across renders: each keeps its cells and their inner
+            // elements, and a render only rewrites their text and classes
+            const rowPool = [];
             
             // Priority mappings for sorting
-            const acmgPriority = {{
+            const acmgPriority = {
                 'Pathogenic': 1,
                 'Likely pathogenic': 2,
                 'VUS H': 3,
@@ -1042,11 +1068,11 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                 'Uncertain significance': 6,
                 'Likely benign': 7,
                 'Benign': 8
-            }};
+            };
             
             // Excel-like Column Resizing System
-            class ExcelColumnResizer {{
-                constructor() {{
+            class ExcelColumnResizer {
+                constructor() {
                     this.isResizing = false;
                     this.currentColumn = null;
                     this.currentColumnIndex = -1;
@@ -1058,34 +1084,51 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                     this.table = document.querySelector('.variants-table');
                     this.columnWidths = new Map();
                     
+                    // Latest pointer position of a drag, applied once per animation frame
+                    this.pendingFrame = 0;
+                    this.lastClientX = 0;
+                    
+                    this.headerCells = Array.from(this.table.querySelectorAll('thead tr th'));
+                    
+                    // One stylesheet rule per column sizes its header and body cells (they
+                    // all carry the column's col-* class), so a resize is a single rule
+                    // update however many rows there are
+                    const style = document.createElement('style');
+                    document.head.appendChild(style);
+                    this.columnRules = this.headerCells.map((headerCell, index) => {
+                        const columnClass = Array.from(headerCell.classList).find(name => name.startsWith('col-'));
+                        style.sheet.insertRule(`.variants-table .${columnClass} {}`, index);
+                        return style.sheet.cssRules[index];
+                    });
+                    
                     this.initializeResizing();
                     this.setInitialColumnWidths();
-                }}
+                }
                 
-                initializeResizing() {{
-                    // Add event listeners to all column resizers
-                    const resizers = document.querySelectorAll('.column-resizer');
-                    resizers.forEach((resizer, index) => {{
-                        resizer.addEventListener('mousedown', (e) => this.startResize(e, resizer));
-                    }});
+                initializeResizing() {
+                    // One listener on the header catches mousedown on any column resizer
+                    this.table.querySelector('thead').addEventListener('mousedown', (e) => {
+                        const resizer = e.target.closest('.column-resizer');
+                        if (resizer) this.startResize(e, resizer);
+                    });
                     
                     // Global mouse event listeners
                     document.addEventListener('mousemove', (e) => this.onMouseMove(e));
                     document.addEventListener('mouseup', (e) => this.endResize(e));
                     
                     // Prevent text selection during resize
-                    document.addEventListener('selectstart', (e) => {{
+                    document.addEventListener('selectstart', (e) => {
                         if (this.isResizing) e.preventDefault();
-                    }});
-                }}
+                    });
+                }
                 
-                startResize(event, resizer) {{
+                startResize(event, resizer) {
                     event.preventDefault();
                     event.stopPropagation();
                     
                     this.isResizing = true;
                     this.currentColumn = resizer.parentElement;
-                    this.currentColumnIndex = Array.from(this.currentColumn.parentElement.children).indexOf(this.currentColumn);
+                    this.currentColumnIndex = this.headerCells.indexOf(this.currentColumn);
                     this.startX = event.clientX;
                     this.startWidth = this.currentColumn.offsetWidth;
                     
@@ -1102,24 +1145,38 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                     document.body.style.userSelect = 'none';
                     document.body.style.webkitUserSelect = 'none';
                     document.body.style.msUserSelect = 'none';
-                }}
+                }
                 
-                onMouseMove(event) {{
+                onMouseMove(event) {
                     if (!this.isResizing) return;
                     
-                    const deltaX = event.clientX - this.startX;
-                    const newWidth = Math.max(this.minWidth, Math.min(this.maxWidth, this.startWidth + deltaX));
-                    
-                    // Update resize line position
-                    this.updateResizeLine(event.clientX);
-                    
-                    // Live preview - update column width
-                    this.updateColumnWidth(this.currentColumnIndex, newWidth);
-                }}
+                    // Mice can report moves faster than the display refreshes, so only
+                    // the latest position is drawn, once per frame
+                    this.lastClientX = event.clientX;
+                    if (this.pendingFrame) return;
+                    this.pendingFrame = requestAnimationFrame(() => {
+                        this.pendingFrame = 0;
+                        if (!this.isResizing) return;
+                        
+                        const deltaX = this.lastClientX - this.startX;
+                        const newWidth = Math.max(this.minWidth, Math.min(this.maxWidth, this.startWidth + deltaX));
+                        
+                        // Update resize line position
+                        this.updateResizeLine(this.lastClientX);
+                        
+                        // Live preview - update column width
+                        this.updateColumnWidth(this.currentColumnIndex, newWidth);
+                    });
+                }
                 
-                endResize(event) {{
+                endResize(event) {
                     if (!this.isResizing) return;
                     
+                    if (this.pendingFrame) {
+                        cancelAnimationFrame(this.pendingFrame);
+                        this.pendingFrame = 0;
+                    }
+                    
                     const deltaX = event.clientX - this.startX;
                     const newWidth = Math.max(this.minWidth, Math.min(this.maxWidth, this.startWidth + deltaX));
                     
@@ -1142,45 +1199,36 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                     this.isResizing = false;
                     this.currentColumn = null;
                     this.currentColumnIndex = -1;
-                }}
+                }
                 
-                showResizeLine(clientX) {{
+                showResizeLine(clientX) {
                     const containerRect = this.table.getBoundingClientRect();
                     this.resizeLine.style.left = clientX + 'px';
                     this.resizeLine.style.top = containerRect.top + window.scrollY + 'px';
                     this.resizeLine.style.height = containerRect.height + 'px';
                     this.resizeLine.style.display = 'block';
                     this.resizeLine.classList.add('active');
-                }}
+                }
                 
-                updateResizeLine(clientX) {{
+                updateResizeLine(clientX) {
                     this.resizeLine.style.left = clientX + 'px';
-                }}
+                }
                 
-                hideResizeLine() {{
+                hideResizeLine() {
                     this.resizeLine.style.display = 'none';
                     this.resizeLine.classList.remove('active');
-                }}
+                }
                 
-                updateColumnWidth(columnIndex, width) {{
-                    // Update header cell
-                    const headerCell = this.table.querySelector(`thead tr th:nth-child(${{columnIndex + 1}})`);
-                    if (headerCell) {{
-                        headerCell.style.width = width + 'px';
-                        headerCell.style.minWidth = width + 'px';
-                        headerCell.style.maxWidth = width + 'px';
-                    }}
-                    
-                    // Update all body cells in this column
-                    const bodyCells = this.table.querySelectorAll(`tbody tr td:nth-child(${{columnIndex + 1}})`);
-                    bodyCells.forEach(cell => {{
-                        cell.style.width = width + 'px';
-                        cell.style.minWidth = width + 'px';
-                        cell.style.maxWidth = width + 'px';
-                    }});
-                }}
+                updateColumnWidth(columnIndex, width) {
+                    const rule = this.columnRules[columnIndex];
+                    if (rule) {
+                        rule.style.setProperty('width', width + 'px');
+                        rule.style.setProperty('min-width', width + 'px');
+                        rule.style.setProperty('max-width', width + 'px');
+                    }
+                }
                 
-                setInitialColumnWidths() {{
+                setInitialColumnWidths() {
                     // Define precise initial widths for each column
                     const initialWidths = [
                         60,   // RANK
@@ -1203,483 +1251,807 @@ def generate_html(file_path, output_path=None, coverage_metrics_path=None):
                     ];
                     
                     // Apply initial widths
-                    initialWidths.forEach((width, index) => {{
+                    initialWidths.forEach((width, index) => {
                         this.updateColumnWidth(index, width);
                         this.columnWidths.set(index, width);
-                    }});
-                }}
-                
-                // Method to refresh column widths after table re-render
-                refreshColumnWidths() {{
-                    this.columnWidths.forEach((width, index) => {{
-                        this.updateColumnWidth(index, width);
-                    }});
-                }}
-            }}
+                    });
+                }
+            }
             
             // Initialize the Excel-like column resizer
             const columnResizer = new ExcelColumnResizer();
             
-            // Function to format variant based on type - Enhanced Professional Version
-            function formatVariant(chr, start, ref, alt) {{
-                // Handle cases where chr might be undefined, null, or 'N/A'
-                if (!chr || chr === 'N/A' || chr === '.' || !start || !ref || !alt) return 'N/A';
-                
-                // Clean up chromosome notation - ensure it has 'chr' prefix
-                let cleanChr = chr.toString().replace(/^chr/i, '');
-                if (cleanChr === '' || cleanChr === 'N/A' || cleanChr === '.') return 'N/A';
-                
-                // Format position
-                const position = start.toString();
-                
-                // Handle deletions
-                if (alt === '.' || alt === '-' || (ref && alt && ref.length > alt.length && alt.length === 1)) {{
-                    const deletedSeq = ref.length > 6 ? ref.substring(0, 6) + '...' : ref;
-                    return `chr${{cleanChr}}:${{position}} del${{deletedSeq}}`;
-                }}
-                
-                // Handle insertions
-                if (ref === '.' || ref === '-' || (ref && alt && alt.length > ref.length && ref.length === 1)) {{
-                    const insertedSeq = alt.length > 6 ? alt.substring(0, 6) + '...' : alt;
-                    return `chr${{cleanChr}}:${{position}} ins${{insertedSeq}}`;
-                }}
-                
-                // Handle SNVs and small variants - Professional formatting
-                return `chr${{cleanChr}}:${{position}} ${{ref}} → ${{alt}}`;
-            }}
-            
-            // Function to get chromosome value with enhanced column name detection
-            function getChromosomeValue(variant) {{
-                // Try different possible chromosome column names including the user's format
-                const possibleKeys = ['#Chr', 'Chr', 'chr', 'CHROM', '#CHROM', 'chromosome'];
-                
-                for (const key of possibleKeys) {{
-                    const value = variant[key];
-                    if (value && value !== '.' && value !== '' && value !== 'N/A') {{
-                        return value;
-                    }}
-                }}
-                
-                return null; // Return null instead of 'N/A' to handle in formatVariant
-            }}
-            
-            // Enhanced function to clean up effect text - Professional Version
-            function cleanEffect(effectText) {{
-                if (!effectText || effectText === 'N/A' || effectText === '.') return 'N/A';
-                
-                // Remove underscores, replace & with |, remove the word "variant"
-                let cleaned = effectText
-                    .replace(/_/g, ' ')
-                    .replace(/&/g, ' | ')
-                    .replace(/\\bvariant\\b/gi, '')
-                    .trim();
-                
-                // Clean up multiple spaces and trim
-                cleaned = cleaned.replace(/\\s+/g, ' ').trim();
-                
-                // Capitalize first letter of each word for professional look
-                cleaned = cleaned.split(' ').map(word => {{
-                    if (word === '|') return word;
-                    return word.length > 0 ? word.charAt(0).toUpperCase() + word.slice(1).toLowerCase() : word;
-                }}).join(' ');
-                
-                return cleaned || 'N/A';
-            }}
+            // The searchable fields of each variant, lower-cased. A text input cannot hold
+            // a newline, so joining on one keeps a search term from matching across two fields.
+            // This is the one pass over all variants at startup, so it runs in idle time
+            // after the first page is shown; a search before it is done finishes it first.
+            V.searchBlob = new Array(variantCount);
+            let searchBlobCount = 0;
             
-            // Professional ACMG Rules formatting function
-            function formatAcmgRules(rulesText) {{
-                if (!rulesText || rulesText === 'N/A' || rulesText === '.') return 'N/A';
-                
-                // Remove commas and clean up spacing
-                return rulesText.replace(/,/g, ' ').replace(/\\s+/g, ' ').trim();
-            }}
+            function buildSearchBlob(end) {
+                for (let i = searchBlobCount; i < end; i++) {
+                    V.searchBlob[i] = [V.gene[i], V.chrom[i], V.rs[i], V.acmg[i], V.effect[i]].join('\\n').toLowerCase();
+                }
+                searchBlobCount = Math.max(searchBlobCount, end);
+            }
             
-            // Function to get ACMG badge class with new VUS variants
-            function getAcmgBadgeClass(classification) {{
-                if (!classification) return 'badge-other';
-                
-                classification = classification.toLowerCase();
-                if (classification.includes('pathogenic') && !classification.includes('likely')) {{
-                    return 'badge-pathogenic';
-                }} else if (classification.includes('likely pathogenic')) {{
-                    return 'badge-likely-pathogenic';
-                }} else if (classification.includes('vus h')) {{
-                    return 'badge-vus-h';
-                }} else if (classification.includes('vus m')) {{
-                    return 'badge-vus';
-                }} else if (classification.includes('vus c')) {{
-                    return 'badge-vus-c';
-                }} else if (classification.includes('vus') || classification.includes('uncertain')) {{
-                    return 'badge-vus';
-                }} else if (classification.includes('likely benign')) {{
-                    return 'badge-likely-benign';
-                }} else if (classification.includes('benign')) {{
-                    return 'badge-benign';
-                }}
-                
-                return 'badge-other';
-            }}
+            const whenIdle = window.requestIdleCallback
+                ? callback => window.requestIdleCallback(callback)
+                : callback => setTimeout(() => callback({ timeRemaining: () => 0 }), 1);
             
-            // Function to combine HGVS information
-            function formatHGVS(featureId, hgvsP, hgvsC) {{
-                if (!featureId && !hgvsP && !hgvsC) return 'N/A';
-                
-                let result = '';
-                if (featureId && featureId !== '.' && featureId !== 'N/A') {{
-                    result = featureId;
-                }}
-                
-                if (hgvsC && hgvsC !== '.' && hgvsC !== 'N/A') {{
-                    result += (result ? ':' : '') + hgvsC;
-                }}
-                
-                if (hgvsP && hgvsP !== '.' && hgvsP !== 'N/A') {{
-                    result += ' ' + hgvsP;
-                }}
-                
-                return result || 'N/A';
-            }}
-            
-            // Function to safely get value from variant
-            function getVariantValue(variant, key, defaultValue = 'N/A') {{
-                const value = variant[key];
-                if (!value || value === '.' || value === '') {{
-                    return defaultValue;
-                }}
-                return value;
-            }}
+            function buildSearchBlobWhenIdle(deadline) {
+                do {
+                    buildSearchBlob(Math.min(variantCount, searchBlobCount + 1000));
+                } while (searchBlobCount < variantCount && deadline.timeRemaining() > 0);
+                if (searchBlobCount < variantCount) whenIdle(buildSearchBlobWhenIdle);
+            }
             
             // Reset button functionality
-            document.getElementById('refreshButton').addEventListener('click', function() {{
-                filteredVariants = [...originalVariants];
+            document.getElementById('refreshButton').addEventListener('click', function() {
+                if (pendingSearch) cancelAnimationFrame(pendingSearch);
+                pendingSearch = 0;
+                searchRequest++;
+                lastSearchTerm = '';
+                showAllVariants();
                 document.getElementById('searchInput').value = '';
                 currentPage = 1;
                 rowsPerPage = 10;
                 document.getElementById('rowsPerPage').value = '10';
                 renderTable(currentPage);
                 renderPaginationControls();
-            }});
+            });
             
             // Rows per page change handler
-            document.getElementById('rowsPerPage').addEventListener('change', function(e) {{
+            document.getElementById('rowsPerPage').addEventListener('change', function(e) {
                 rowsPerPage = parseInt(e.target.value);
                 currentPage = 1;
                 renderTable(currentPage);
                 renderPaginationControls();
-            }});
+            });
             
-            // Search functionality
-            document.getElementById('searchInput').addEventListener('input', function(e) {{
-                const searchTerm = e.target.value.toLowerCase();
-                
-                if (searchTerm === '') {{
-                    filteredVariants = [...allVariants];
-                }} else {{
-                    filteredVariants = allVariants.filter(variant => {{
-                        return (
-                            (getVariantValue(variant, 'Ref.Gene', '').toLowerCase().includes(searchTerm)) ||
-                            (getChromosomeValue(variant) && getChromosomeValue(variant).toString().toLowerCase().includes(searchTerm)) ||
-                            (getVariantValue(variant, 'avsnp151', '').toLowerCase().includes(searchTerm)) ||
-                            (getVariantValue(variant, 'ACMG', '').toLowerCase().includes(searchTerm)) ||
-                            (cleanEffect(getVariantValue(variant, 'ANN[0].EFFECT', '')).toLowerCase().includes(searchTerm))
-                        );
-                    }});
-                }}
+            // Search functionality. Keystrokes are coalesced into one search per
+            // animation frame, so fast typing only filters for the last one.
+            let lastSearchTerm = '';
+            let pendingSearch = 0;
+            let searchRequest = 0;
+            
+            function runSearch(searchTerm) {
+                if (searchTerm === '') {
+                    showAllVariants();
+                } else {
+                    buildSearchBlob(variantCount);
+                    
+                    // A term that extends the previous one can only narrow its matches,
+                    // so only those need checking (in place: n never passes k)
+                    const narrowing = lastSearchTerm !== '' && searchTerm.startsWith(lastSearchTerm);
+                    const count = narrowing ? filteredCount : variantCount;
+                    let n = 0;
+                    for (let k = 0; k < count; k++) {
+                        const i = narrowing ? filteredIndices[k] : k;
+                        if (V.searchBlob[i].includes(searchTerm)) {
+                            filteredIndices[n++] = i;
+                        }
+                    }
+                    filteredCount = n;
+                }
+                lastSearchTerm = searchTerm;
                 
                 currentPage = 1;
                 renderTable(currentPage);
                 renderPaginationControls();
-            }});
+            }
+            
+            document.getElementById('searchInput').addEventListener('input', function(e) {
+                const searchTerm = e.target.value.toLowerCase();
+                if (pendingSearch) cancelAnimationFrame(pendingSearch);
+                const request = ++searchRequest;
+                pendingSearch = requestAnimationFrame(() => {
+                    pendingSearch = 0;
+                    // Searching needs every block; a newer search or a reset wins
+                    loadAllBlocks().then(() => {
+                        if (request === searchRequest) runSearch(searchTerm);
+                    });
+                });
+            });
+            
+            // Class of each cell in a variant row, in column order
+            const cellClasses = [
+                'col-rank', 'col-variant', 'col-variant-type', 'col-gene', 'col-rs',
+                'col-acmg', 'col-acmg-rules', 'col-hgvs', 'col-hgvs-protein', 'col-hgvs-coding',
+                'col-inheritance', 'col-effect', 'col-zygosity', 'col-gnomad',
+                'col-allelic-balance', 'col-depth', 'col-filter'
+            ];
+            
+            // Row shown in place of the variants when nothing matches the search
+            const emptyRow = document.createElement('tr');
+            emptyRow.innerHTML = `
+                <td colspan="17" style="text-align: center; padding: 20px;">
+                    No variants match your search criteria.
+                </td>
+            `;
+            
+            // Elements a pooled cell can show, by cell class
+            const cellContent = {
+                'col-rank': '<div class="rank-bubble"></div>',
+                'col-variant': '<span class="variant-code"></span>',
+                'col-gene': '<a class="gene-link" target="_blank"></a>',
+                'col-acmg': '<span class="badge"></span>',
+                'col-acmg-rules': '<span class="acmg-rules"></span>',
+                'col-effect': '<span class="effect-text"></span>',
+                'col-filter': '<i></i>'
+            };
+            
+            // Markup of a pooled row
+            const poolRowHtml = '<tr>' + cellClasses.map(className =>
+                `<td class="${className}">${cellContent[className] || ''}</td>`
+            ).join('') + '</tr>';
+            
+            // Add rows to the pool until it holds `size`, parsing all new rows in one pass
+            function growRowPool(size) {
+                const missing = size - rowPool.length;
+                if (missing <= 0) return;
+                
+                const container = document.createElement('tbody');
+                container.innerHTML = poolRowHtml.repeat(missing);
+                Array.from(container.children).forEach(row => {
+                    const cells = Array.from(row.children);
+                    rowPool.push({
+                        row: row,
+                        cells: cells,
+                        variantIndex: -1,
+                        rankBubble: cells[0].firstElementChild,
+                        variantSpan: cells[1].firstElementChild,
+                        geneLink: cells[3].firstElementChild,
+                        badge: cells[5].firstElementChild,
+                        rulesSpan: cells[6].firstElementChild,
+                        effectSpan: cells[11].firstElementChild,
+                        filterIcon: cells[16].firstElementChild
+                    });
+                });
+            }
+            
+            // Show a pooled element as the content of a cell
+            function showCellElement(cell, className, el) {
+                cell.className = className;
+                if (cell.firstChild !== el) cell.replaceChildren(el);
+            }
+            
+            // Show N/A as the content of a cell
+            function showCellNotAvailable(cell, className) {
+                cell.className = className + ' not-available';
+                cell.textContent = 'N/A';
+            }
             
             // Render table with pagination
-            function renderTable(page) {{
+            function renderTable(page) {
                 const startIndex = (page - 1) * rowsPerPage;
                 const endIndex = startIndex + rowsPerPage;
-                const displayedVariants = filteredVariants.slice(startIndex, endIndex);
+                const displayedIndices = filteredIndices.subarray(startIndex, Math.min(endIndex, filteredCount));
                 
                 const tbody = document.getElementById('variantsTableBody');
-                tbody.innerHTML = '';
                 
-                if (displayedVariants.length === 0) {{
-                    tbody.innerHTML = `
-                        <tr>
-                            <td colspan="17" style="text-align: center; padding: 20px;">
-                                No variants match your search criteria.
-                            </td>
-                        </tr>
-                    `;
-                    // Refresh column widths after table re-render
-                    setTimeout(() => columnResizer.refreshColumnWidths(), 10);
+                if (displayedIndices.length === 0) {
+                    tbody.replaceChildren(emptyRow);
                     return;
-                }}
+                }
                 
-                displayedVariants.forEach((variant, index) => {{
-                    const row = document.createElement('tr');
+                // Rows of blocks not inflated yet are shown once they are
+                const missingBlocks = [];
+                for (const i of displayedIndices) {
+                    const b = Math.floor(i / variantBlockSize);
+                    if (!blockReady[b] && !missingBlocks.includes(b)) missingBlocks.push(b);
+                }
+                if (missingBlocks.length) {
+                    Promise.all(missingBlocks.map(loadBlock)).then(() => {
+                        if (page === currentPage) renderTable(page);
+                    });
+                    return;
+                }
+                
+                growRowPool(displayedIndices.length);
+                
+                displayedIndices.forEach((i, index) => {
+                    const entry = rowPool[index];
+                    const cells = entry.cells;
                     
                     // RANK
-                    const rankCell = document.createElement('td');
-                    rankCell.className = 'col-rank';
-                    const rankBubble = document.createElement('div');
-                    rankBubble.className = 'rank-bubble';
-                    rankBubble.textContent = startIndex + index + 1;
-                    rankCell.appendChild(rankBubble);
-                    row.appendChild(rankCell);
+                    entry.rankBubble.textContent = startIndex + index + 1;
+                    
+                    // Everything else only depends on the variant, so a row that still shows
+                    // the same one (as the top rows often do while a search is narrowed) is
+                    // left as it is
+                    if (entry.variantIndex === i) return;
+                    entry.variantIndex = i;
                     
                     // VARIANT - Enhanced Professional Formatting
-                    const variantCell = document.createElement('td');
-                    variantCell.className = 'col-variant';
-                    const variantSpan = document.createElement('span');
-                    variantSpan.className = 'variant-code';
-                    variantSpan.textContent = formatVariant(
-                        getChromosomeValue(variant),
-                        getVariantValue(variant, 'Start'),
-                        getVariantValue(variant, 'Ref'),
-                        getVariantValue(variant, 'Alt')
-                    );
-                    variantCell.appendChild(variantSpan);
-                    row.appendChild(variantCell);
+                    entry.variantSpan.textContent = V.variantLabel[i];
                     
                     // VARIANT TYPE
-                    const variantTypeCell = document.createElement('td');
-                    variantTypeCell.className = 'col-variant-type';
-                    variantTypeCell.textContent = getVariantValue(variant, 'Variant Type');
-                    row.appendChild(variantTypeCell);
+                    cells[2].textContent = V.variantType[i];
                     
                     // GENE
-                    const geneCell = document.createElement('td');
-                    geneCell.className = 'col-gene';
-                    const geneLink = document.createElement('a');
-                    geneLink.href = `https://www.genecards.org/cgi-bin/carddisp.pl?gene=${{getVariantValue(variant, 'Ref.Gene')}}`;
-                    geneLink.target = '_blank';
-                    geneLink.className = 'gene-link';
-                    geneLink.textContent = getVariantValue(variant, 'Ref.Gene');
-                    geneCell.appendChild(geneLink);
-                    row.appendChild(geneCell);
+                    const gene = V.gene[i] || 'N/A';
+                    entry.geneLink.href = `https://www.genecards.org/cgi-bin/carddisp.pl?gene=${gene}`;
+                    entry.geneLink.textContent = gene;
                     
                     // RS
-                    const rsCell = document.createElement('td');
-                    rsCell.className = 'col-rs';
-                    rsCell.textContent = getVariantValue(variant, 'avsnp151');
-                    row.appendChild(rsCell);
+                    cells[4].textContent = V.rs[i] || 'N/A';
                     
-                    // ACMG
-                    const acmgCell = document.createElement('td');
-                    acmgCell.className = 'col-acmg';
-                    const acmgValue = getVariantValue(variant, 'ACMG');
-                    if (acmgValue !== 'N/A') {{
-                        const badge = document.createElement('span');
-                        badge.className = `badge ${{getAcmgBadgeClass(acmgValue)}}`;
-                        badge.textContent = acmgValue;
-                        acmgCell.appendChild(badge);
-                    }} else {{
-                        acmgCell.textContent = 'N/A';
-                        acmgCell.className += ' not-available';
-                    }}
-                    row.appendChild(acmgCell);
+                    // ACMG (a literal 'N/A' is shown as not available, but stays searchable)
+                    if (V.acmg[i] && V.acmg[i] !== 'N/A') {
+                        entry.badge.className = V.acmgBadgeClass[i];
+                        entry.badge.textContent = V.acmg[i];
+                        showCellElement(cells[5], 'col-acmg', entry.badge);
+                    } else {
+                        showCellNotAvailable(cells[5], 'col-acmg');
+                    }
                     
                     // ACMG RULES - Enhanced Professional Formatting
-                    const acmgRulesCell = document.createElement('td');
-                    acmgRulesCell.className = 'col-acmg-rules';
-                    const acmgRulesValue = getVariantValue(variant, 'ACMG_Rules');
-                    if (acmgRulesValue !== 'N/A') {{
-                        const rulesSpan = document.createElement('span');
-                        rulesSpan.className = 'acmg-rules';
-                        rulesSpan.textContent = formatAcmgRules(acmgRulesValue);
-                        acmgRulesCell.appendChild(rulesSpan);
-                    }} else {{
-                        acmgRulesCell.textContent = 'N/A';
-                        acmgRulesCell.className += ' not-available';
-                    }}
-                    row.appendChild(acmgRulesCell);
+                    if (V.acmgRules[i] !== 'N/A') {
+                        entry.rulesSpan.textContent = V.acmgRules[i];
+                        showCellElement(cells[6], 'col-acmg-rules', entry.rulesSpan);
+                    } else {
+                        showCellNotAvailable(cells[6], 'col-acmg-rules');
+                    }
                     
                     // HGVS (combined)
-                    const hgvsCell = document.createElement('td');
-                    hgvsCell.className = 'col-hgvs';
-                    hgvsCell.textContent = formatHGVS(
-                        getVariantValue(variant, 'ANN[0].FEATUREID'),
-                        getVariantValue(variant, 'ANN[0].HGVS_P'),
-                        getVariantValue(variant, 'ANN[0].HGVS_C')
-                    );
-                    row.appendChild(hgvsCell);
+                    cells[7].textContent = V.hgvs[i];
                     
                     // HGVS PROTEIN
-                    const hgvsProteinCell = document.createElement('td');
-                    hgvsProteinCell.className = 'col-hgvs-protein';
-                    hgvsProteinCell.textContent = getVariantValue(variant, 'ANN[0].HGVS_P');
-                    row.appendChild(hgvsProteinCell);
+                    cells[8].textContent = V.hgvsP[i];
                     
                     // HGVS CODING
-                    const hgvsCodingCell = document.createElement('td');
-                    hgvsCodingCell.className = 'col-hgvs-coding';
-                    hgvsCodingCell.textContent = getVariantValue(variant, 'ANN[0].HGVS_C');
-                    row.appendChild(hgvsCodingCell);
+                    cells[9].textContent = V.hgvsC[i];
                     
                     // INHERITANCE
-                    const inheritanceCell = document.createElement('td');
-                    inheritanceCell.className = 'col-inheritance';
-                    inheritanceCell.textContent = getVariantValue(variant, 'Inheritance');
-                    row.appendChild(inheritanceCell);
+                    cells[10].textContent = V.inheritance[i];
                     
                     // EFFECT - Enhanced Professional Formatting
-                    const effectCell = document.createElement('td');
-                    effectCell.className = 'col-effect';
-                    const effectValue = cleanEffect(getVariantValue(variant, 'ANN[0].EFFECT'));
-                    if (effectValue !== 'N/A') {{
-                        const effectSpan = document.createElement('span');
-                        effectSpan.className = 'effect-text';
-                        effectSpan.textContent = effectValue;
-                        effectCell.appendChild(effectSpan);
-                    }} else {{
-                        effectCell.textContent = 'N/A';
-                        effectCell.className += ' not-available';
-                    }}
-                    row.appendChild(effectCell);
+                    if (V.effect[i] !== 'N/A') {
+                        entry.effectSpan.textContent = V.effect[i];
+                        showCellElement(cells[11], 'col-effect', entry.effectSpan);
+                    } else {
+                        showCellNotAvailable(cells[11], 'col-effect');
+                    }
                     
                     // ZYGOSITY
-                    const zygosityCell = document.createElement('td');
-                    zygosityCell.className = 'col-zygosity';
-                    zygosityCell.textContent = getVariantValue(variant, 'Otherinfo');
-                    row.appendChild(zygosityCell);
+                    cells[12].textContent = V.zygosity[i];
                     
                     // GNOMAD
-                    const gnomadCell = document.createElement('td');
-                    gnomadCell.className = 'col-gnomad';
-                    gnomadCell.textContent = getVariantValue(variant, 'Freq_gnomAD_genome_ALL');
-                    row.appendChild(gnomadCell);
+                    cells[13].textContent = V.gnomad[i];
                     
                     // ALLELIC BALANCE
-                    const allelicBalanceCell = document.createElement('td');
-                    allelicBalanceCell.className = 'col-allelic-balance';
-                    allelicBalanceCell.textContent = getVariantValue(variant, 'Allelic Balance');
-                    row.appendChild(allelicBalanceCell);
+                    cells[14].textContent = V.allelicBalance[i];
                     
                     // DEPTH
-                    const depthCell = document.createElement('td');
-                    depthCell.className = 'col-depth';
-                    depthCell.textContent = getVariantValue(variant, 'DP');
-                    row.appendChild(depthCell);
+                    cells[15].textContent = V.depth[i];
                     
                     // FILTER
-                    const filterCell = document.createElement('td');
-                    filterCell.className = 'col-filter';
-                    const filterValue = getVariantValue(variant, 'FILTER');
-                    
-                    if (filterValue === 'PASS') {{
-                        const icon = document.createElement('i');
-                        icon.className = 'fas fa-check-circle filter-pass';
-                        filterCell.appendChild(icon);
-                    }} else if (filterValue !== 'N/A') {{
-                        const icon = document.createElement('i');
-                        icon.className = 'fas fa-times-circle filter-fail';
-                        filterCell.appendChild(icon);
-                    }} else {{
-                        filterCell.textContent = 'N/A';
-                        filterCell.className += ' not-available';
-                    }}
-                    row.appendChild(filterCell);
-                    
-                    tbody.appendChild(row);
-                }});
+                    const filterValue = V.filter[i];
+                    if (filterValue !== 'N/A') {
+                        entry.filterIcon.className = filterValue === 'PASS'
+                            ? 'fas fa-check-circle filter-pass'
+                            : 'fas fa-times-circle filter-fail';
+                        showCellElement(cells[16], 'col-filter', entry.filterIcon);
+                    } else {
+                        showCellNotAvailable(cells[16], 'col-filter');
+                    }
+                });
                 
-                // Refresh column widths after table re-render
-                setTimeout(() => columnResizer.refreshColumnWidths(), 10);
-            }}
+                tbody.replaceChildren(...rowPool.slice(0, displayedIndices.length).map(entry => entry.row));
+            }
+            
+            // Page navigation buttons, created once and updated on every render. Each
+            // carries the page it leads to, and one listener handles them all.
+            const pageNavigation = document.getElementById('pageNavigation');
+            const prevBtn = document.createElement('button');
+            prevBtn.className = 'page-nav-btn';
+            prevBtn.innerHTML = '<i class="fas fa-chevron-left"></i>';
+            const nextBtn = document.createElement('button');
+            nextBtn.className = 'page-nav-btn';
+            nextBtn.innerHTML = '<i class="fas fa-chevron-right"></i>';
+            const pageBtnPool = [];
+            
+            pageNavigation.addEventListener('click', function(e) {
+                const button = e.target.closest('button');
+                if (!button || button.disabled || !button.dataset.page) return;
+                currentPage = parseInt(button.dataset.page);
+                renderTable(currentPage);
+                renderPaginationControls();
+            });
             
             // Render pagination controls
-            function renderPaginationControls() {{
-                const totalVariants = filteredVariants.length;
+            function renderPaginationControls() {
+                const totalVariants = filteredCount;
                 const totalPages = Math.ceil(totalVariants / rowsPerPage);
                 const startIndex = (currentPage - 1) * rowsPerPage + 1;
                 const endIndex = Math.min(currentPage * rowsPerPage, totalVariants);
                 
                 // Update page info
                 document.getElementById('pageInfo').textContent = 
-                    `Showing ${{startIndex}}-${{endIndex}} of ${{totalVariants}} variants`;
-                
-                // Generate page navigation
-                const pageNavigation = document.getElementById('pageNavigation');
-                pageNavigation.innerHTML = '';
+                    `Showing ${startIndex}-${endIndex} of ${totalVariants} variants`;
                 
                 // Previous button
-                const prevBtn = document.createElement('button');
-                prevBtn.className = 'page-nav-btn';
-                prevBtn.innerHTML = '<i class="fas fa-chevron-left"></i>';
                 prevBtn.disabled = currentPage === 1;
-                prevBtn.addEventListener('click', () => {{
-                    if (currentPage > 1) {{
-                        currentPage--;
-                        renderTable(currentPage);
-                        renderPaginationControls();
-                    }}
-                }});
-                pageNavigation.appendChild(prevBtn);
+                prevBtn.dataset.page = currentPage > 1 ? currentPage - 1 : '';
                 
                 // Page number buttons
                 const maxButtons = 5;
                 let startPage = Math.max(1, currentPage - Math.floor(maxButtons / 2));
                 let endPage = Math.min(totalPages, startPage + maxButtons - 1);
                 
-                if (endPage - startPage + 1 < maxButtons && startPage > 1) {{
+                if (endPage - startPage + 1 < maxButtons && startPage > 1) {
                     startPage = Math.max(1, endPage - maxButtons + 1);
-                }}
+                }
                 
-                for (let i = startPage; i <= endPage; i++) {{
-                    const pageBtn = document.createElement('button');
-                    pageBtn.className = `page-nav-btn ${{i === currentPage ? 'active' : ''}}`;
+                const pageCount = Math.max(0, endPage - startPage + 1);
+                while (pageBtnPool.length < pageCount) {
+                    pageBtnPool.push(document.createElement('button'));
+                }
+                for (let k = 0; k < pageCount; k++) {
+                    const i = startPage + k;
+                    const pageBtn = pageBtnPool[k];
+                    pageBtn.className = `page-nav-btn ${i === currentPage ? 'active' : ''}`;
                     pageBtn.textContent = i;
-                    pageBtn.addEventListener('click', () => {{
-                        currentPage = i;
-                        renderTable(currentPage);
-                        renderPaginationControls();
-                    }});
-                    pageNavigation.appendChild(pageBtn);
-                }}
+                    pageBtn.dataset.page = i;
+                }
                 
                 // Next button
-                const nextBtn = document.createElement('button');
-                nextBtn.className = 'page-nav-btn';
-                nextBtn.innerHTML = '<i class="fas fa-chevron-right"></i>';
                 nextBtn.disabled = currentPage === totalPages;
-                nextBtn.addEventListener('click', () => {{
-                    if (currentPage < totalPages) {{
-                        currentPage++;
-                        renderTable(currentPage);
-                        renderPaginationControls();
-                    }}
-                }});
-                pageNavigation.appendChild(nextBtn);
-            }}
+                nextBtn.dataset.page = currentPage < totalPages ? currentPage + 1 : '';
+                
+                pageNavigation.replaceChildren(prevBtn, ...pageBtnPool.slice(0, pageCount), nextBtn);
+            }
             
             // Initialize
             renderTable(currentPage);
             renderPaginationControls();
-        }});
+            loadAllBlocks().then(() => whenIdle(buildSearchBlobWhenIdle));
+        });
     </script>
 </body>
 </html>"""
+
+def read_tsv_file(file_path):
+    """
+    Read TSV file and return headers and data rows. Every backend applies the
+    same rule: rows with fewer fields than the header are skipped and longer
+    rows are cut to the header's width.
+    """
+    if pa_csv is not None:
+        return read_tsv_file_arrow(file_path)
+    if pd is not None:
+        return read_tsv_file_pandas(file_path)
+    return read_tsv_file_csv(file_path)
+
+def read_tsv_file_pandas(file_path):
+    """
+    read_tsv_file on top of pandas' C reader. pandas pads short rows with ''
+    and cannot cut long ones, so the field count of every line is checked
+    first with numpy over the raw bytes. Files that check cannot vouch for
+    (short or long rows, quoted fields, carriage returns) are read with the
+    csv reader instead.
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if not data or b'"' in data or b'\r' in data:
+        return read_tsv_file_csv(file_path)
+    
+    buf = np.frombuffer(data, dtype=np.uint8)
+    # Where every line ends (the last one may lack its newline), and its number of tabs
+    ends = np.flatnonzero(buf == ord('\n'))
+    if ends.size == 0 or ends[-1] != buf.size - 1:
+        ends = np.append(ends, buf.size)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    tabs = np.diff(np.searchsorted(np.flatnonzero(buf == ord('\t')), ends), prepend=0)
+    # Blank lines are skipped by every reader; all others need the header's field count
+    blank = ends == starts
+    if blank[0] or not np.all(blank[1:] | (tabs[1:] == tabs[0])):
+        return read_tsv_file_csv(file_path)
+    
+    headers = data[:ends[0]].decode('utf-8-sig').split('\t')
+    if headers == ['']:
+        # A header line holding only a byte-order mark
+        return read_tsv_file_csv(file_path)
+    # Keep every field as the literal string from the file (no NA or number parsing);
+    # plain object columns skip the conversion to pandas' string dtype
+    df = pd.read_csv(io.BytesIO(data), sep='\t', header=None, skiprows=1, names=range(len(headers)),
+                     dtype=object, keep_default_na=False, na_filter=False, index_col=False,
+                     encoding='utf-8', engine='c')
+    # One list of values per row, in header order (a variant's rank is its position)
+    return headers, df.to_numpy().tolist()
+
+def read_tsv_file_arrow(file_path):
+    """
+    read_tsv_file on top of pyarrow, which parses blocks of the file in parallel
+    threads. Rows with fewer fields than the header are skipped. pyarrow cannot
+    truncate longer rows, so a file holding one is read with the csv reader,
+    which cuts them to the header's width as the original reader did.
+    """
+    # Every column is read as a string, so the column names are needed up front
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        headers = f.readline().rstrip('\r\n').split('\t')
+    long_rows = []
+    
+    def invalid_row(row):
+        if row.actual_columns > row.expected_columns:
+            long_rows.append(row)
+        return 'skip'
+    
+    table = pa_csv.read_csv(
+        file_path,
+        parse_options=pa_csv.ParseOptions(delimiter='\t', invalid_row_handler=invalid_row),
+        convert_options=pa_csv.ConvertOptions(column_types=dict.fromkeys(headers, pa.string()),
+                                              strings_can_be_null=False,
+                                              quoted_strings_can_be_null=False))
+    if long_rows:
+        return read_tsv_file_csv(file_path)
+    # Transpose the columns into one tuple of values per row
+    rows = list(zip(*(column.to_pylist() for column in table.columns)))
+    return table.column_names, rows
+
+def read_tsv_file_csv(file_path):
+    """
+    read_tsv_file with only the standard library. csv.reader already builds
+    each row as a list in C, which is the row format used here, so rows are
+    kept as they come. As in the original reader, rows with fewer fields than
+    the header are skipped and longer rows are cut to the header's width.
+    """
+    # newline='' leaves line endings to the csv module, as its docs require
+    with open(file_path, 'r', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+        reader = csv.reader(f, delimiter='\t')
+        headers = next(reader)  # Get the first row as headers
+        rows = list(reader)
+    # Well-formed files are the norm, so check the field counts at C level and
+    # only filter and truncate row by row when a short or long row is present
+    n_fields = len(headers)
+    lengths = list(map(len, rows))
+    if min(lengths, default=n_fields) < n_fields or max(lengths, default=n_fields) > n_fields:
+        rows = [row[:n_fields] for row in rows if len(row) >= n_fields]
+    return headers, rows
+
+def read_coverage_metrics(file_path):
+    """Read coverage metrics file and extract key values, or None if it does not exist"""
+    metrics = {}
+    try:
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Extract sample ID from the first line
+            first_line = mm.readline().decode('utf-8')
+            sample_id = first_line.split(':')[-1].strip() if ':' in first_line else "Unknown"
+            metrics['sample_id'] = sample_id
+            
+            # Pick out all metric lines in one regex pass over the mapped file,
+            # decoding only the captured text (first occurrence wins)
+            values = {}
+            for name, value in _METRIC_RE.findall(mm):
+                values.setdefault(name.decode('utf-8'), value.decode('utf-8').strip())
+            
+            raw_reads = values.get('Raw reads', "N/A")
+            trimmed_reads = values.get('Trimmed reads', "N/A")
+            
+            # Remove "(total from R1 and R2)" from raw and trimmed reads
+            metrics['raw_reads'] = raw_reads.replace("(total from R1 and R2)", "").strip()
+            metrics['trimmed_reads'] = trimmed_reads.replace("(total from R1 and R2)", "").strip()
+            
+            metrics['mean_read_length'] = values.get('Mean read length', "N/A")
+            metrics['uniquely_mapped_reads'] = values.get('Uniquely mapped reads', "N/A").split(' ')[0]
+            metrics['duplicate_reads'] = values.get('Duplicate reads', "N/A").split(' ')[0]
+            metrics['average_coverage'] = values.get('Average coverage', "N/A")
+            metrics['bases_10x'] = values.get('Percentage of bases with ≥10X coverage', "N/A")
+            metrics['bases_30x'] = values.get('Percentage of bases with ≥30X coverage', "N/A")
+            metrics['bases_50x'] = values.get('Percentage of bases with ≥50X coverage', "N/A")
+            metrics['bases_100x'] = values.get('Percentage of bases with ≥100X coverage', "N/A")
+            metrics['bases_200x'] = values.get('Percentage of bases with ≥200X coverage', "N/A")
+            metrics['bases_300x'] = values.get('Percentage of bases with ≥300X coverage', "N/A")
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: Could not read coverage metrics file: {e}")
+        # Set default values
+        metrics = {
+            'sample_id': "Unknown",
+            'raw_reads': "N/A",
+            'trimmed_reads': "N/A",
+            'mean_read_length': "N/A",
+            'uniquely_mapped_reads': "N/A",
+            'duplicate_reads': "N/A",
+            'average_coverage': "N/A",
+            'bases_10x': "N/A",
+            'bases_30x': "N/A",
+            'bases_50x': "N/A",
+            'bases_100x': "N/A",
+            'bases_200x': "N/A",
+            'bases_300x': "N/A"
+        }
+    return metrics
+
+def format_variant(chrom, start, ref, alt):
+    """Format a variant as chrN:position followed by the deletion, insertion or change"""
+    if not chrom or chrom in ('N/A', '.') or not start or not ref or not alt:
+        return 'N/A'
+    
+    # Clean up chromosome notation - ensure it has 'chr' prefix
+    clean_chr = chrom[3:] if chrom[:3].lower() == 'chr' else chrom
+    if clean_chr in ('', 'N/A', '.'):
+        return 'N/A'
+    
+    # Handle deletions
+    if alt in ('.', '-') or (len(ref) > len(alt) and len(alt) == 1):
+        deleted_seq = ref[:6] + '...' if len(ref) > 6 else ref
+        return f"chr{clean_chr}:{start} del{deleted_seq}"
+    
+    # Handle insertions
+    if ref in ('.', '-') or (len(alt) > len(ref) and len(ref) == 1):
+        inserted_seq = alt[:6] + '...' if len(alt) > 6 else alt
+        return f"chr{clean_chr}:{start} ins{inserted_seq}"
+    
+    # Handle SNVs and small variants
+    return f"chr{clean_chr}:{start} {ref} → {alt}"
+
+def clean_effect(effect_text):
+    """Make an effect readable: no underscores or the word 'variant', '&' as '|', words capitalized"""
+    if not effect_text or effect_text in ('N/A', '.'):
+        return 'N/A'
+    
+    cleaned = _VARIANT_WORD_RE.sub('', effect_text.replace('_', ' ').replace('&', ' | '))
+    cleaned = _SPACES_RE.sub(' ', cleaned.strip()).strip()
+    cleaned = ' '.join(word if word == '|' else word[:1].upper() + word[1:].lower()
+                       for word in cleaned.split(' '))
+    return cleaned or 'N/A'
+
+def format_acmg_rules(rules_text):
+    """Show the ACMG rules separated by single spaces instead of commas"""
+    if not rules_text or rules_text in ('N/A', '.'):
+        return 'N/A'
+    return _SPACES_RE.sub(' ', rules_text.replace(',', ' ')).strip()
+
+def get_acmg_badge_class(classification):
+    """CSS class of the badge for an ACMG classification"""
+    if not classification:
+        return 'badge-other'
+    
+    classification = classification.lower()
+    badge_class = _ACMG_BADGE_CLASSES.get(classification)
+    if badge_class is not None:
+        return badge_class
+    
+    # Anything else is matched on the words it contains
+    if 'pathogenic' in classification and 'likely' not in classification:
+        return 'badge-pathogenic'
+    elif 'likely pathogenic' in classification:
+        return 'badge-likely-pathogenic'
+    elif 'vus h' in classification:
+        return 'badge-vus-h'
+    elif 'vus m' in classification:
+        return 'badge-vus'
+    elif 'vus c' in classification:
+        return 'badge-vus-c'
+    elif 'vus' in classification or 'uncertain' in classification:
+        return 'badge-vus'
+    elif 'likely benign' in classification:
+        return 'badge-likely-benign'
+    elif 'benign' in classification:
+        return 'badge-benign'
+    
+    return 'badge-other'
+
+def format_hgvs(feature_id, hgvs_p, hgvs_c):
+    """Combine transcript, coding and protein HGVS into one string"""
+    result = ''
+    if feature_id not in ('.', 'N/A'):
+        result = feature_id
     
-    # Write the HTML file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    if hgvs_c not in ('.', 'N/A'):
+        result += (':' if result else '') + hgvs_c
+    
+    if hgvs_p not in ('.', 'N/A'):
+        result += ' ' + hgvs_p
+    
+    return result or 'N/A'
+
+def variant_columns(headers, variants):
+    """
+    Turn the TSV rows into the fields shown in the report, as one list per
+    field holding that field of every variant in row order. All formatting is
+    done here once, so the browser only has to look values up. Gene, rs and
+    ACMG are '' when missing (so a search cannot match a placeholder); every
+    other field is 'N/A'.
+    """
+    position = {name: i for i, name in enumerate(headers)}
+    
+    def column(name, default='N/A'):
+        # A field of every variant, with empty and '.' values replaced by default
+        i = position.get(name)
+        if i is None:
+            return [default] * len(variants)
+        return [value if value and value != '.' else default for value in map(itemgetter(i), variants)]
+    
+    # The first usable chromosome column, in order of preference. A file normally
+    # has just one of them, which then needs no per-variant probing.
+    chrom_columns = [column(key, None) for key in _CHROM_KEYS if key in position]
+    if len(chrom_columns) == 1:
+        chrom = [value if value != 'N/A' else None for value in chrom_columns[0]]
+    elif chrom_columns:
+        chrom = [next((value for value in values if value is not None and value != 'N/A'), None)
+                 for values in zip(*chrom_columns)]
+    else:
+        chrom = [None] * len(variants)
+    
+    acmg = column('ACMG', '')
+    # A handful of distinct classifications, so each is only looked up once
+    badge_classes = {value: 'badge ' + get_acmg_badge_class(value) for value in set(acmg)}
+    # Effects repeat a lot too (missense, synonymous, ...), so each distinct one is cleaned once
+    effect = column('ANN[0].EFFECT')
+    clean_effects = {value: clean_effect(value) for value in set(effect)}
+    hgvs_p = column('ANN[0].HGVS_P')
+    hgvs_c = column('ANN[0].HGVS_C')
+    return {
+        'variantLabel': list(map(format_variant, chrom, column('Start'), column('Ref'), column('Alt'))),
+        'variantType': column('Variant Type'),
+        'gene': column('Ref.Gene', ''),
+        'chrom': [value or '' for value in chrom],
+        'rs': column('avsnp151', ''),
+        'acmg': acmg,
+        'acmgBadgeClass': list(map(badge_classes.__getitem__, acmg)),
+        'acmgRules': list(map(format_acmg_rules, column('ACMG_Rules'))),
+        'hgvs': list(map(format_hgvs, column('ANN[0].FEATUREID'), hgvs_p, hgvs_c)),
+        'hgvsP': hgvs_p,
+        'hgvsC': hgvs_c,
+        'inheritance': column('Inheritance'),
+        'effect': list(map(clean_effects.__getitem__, effect)),
+        'zygosity': column('Otherinfo'),
+        'gnomad': column('Freq_gnomAD_genome_ALL'),
+        'allelicBalance': column('Allelic Balance'),
+        'depth': column('DP'),
+        'filter': column('FILTER'),
+    }
+
+def encode_column(values):
+    """
+    A column as written to the report. Columns with few distinct values (ACMG,
+    zygosity, FILTER, ...) are dictionary-encoded as {"values": distinct values,
+    "codes": index into values per variant}, which is far shorter than repeating
+    the strings; other columns are written as they are.
+    """
+    codes = {}
+    indexes = [codes.setdefault(value, len(codes)) for value in values]
+    if len(codes) > len(values) // 10:
+        return values
+    return {'values': list(codes), 'codes': indexes}
+
+def write_variants_json(f, columns):
+    """
+    Write the report columns to an open file as gzip-compressed, base64-encoded
+    JSON. Columns are compressed one at a time, so apart from the compressed
+    data only one column of JSON is held in memory at a time.
+    """
+    # Level 1 gets most of the size reduction for a fraction of the CPU time of
+    # the higher levels. wbits=31 writes a gzip stream, as the browser's
+    # DecompressionStream('gzip') expects.
+    gz = zlib.compressobj(1, wbits=31)
+    chunks = []
+    for n, (name, values) in enumerate(columns.items()):
+        chunks.append(gz.compress(((',' if n else '{') + _json_dumps(name) + ':' +
+                                   _json_dumps(encode_column(values))).encode('utf-8')))
+    chunks.append(gz.compress(b'}'))
+    chunks.append(gz.flush())
+    f.write(base64.b64encode(b''.join(chunks)).decode('ascii'))
+
+def write_data_script(f, columns):
+    """
+    Write the script that defines the variant data, as separately compressed
+    blocks of _DATA_BLOCK_SIZE variants (always at least one block)
+    """
+    count = len(next(iter(columns.values())))
+    f.write(_DATA_SCRIPT_START)
+    f.write(f"        const variantCount = {count};\n"
+            f"        const variantBlockSize = {_DATA_BLOCK_SIZE};\n"
+            "        const variantBlocksGz = [\n")
+    for start in range(0, max(count, 1), _DATA_BLOCK_SIZE):
+        f.write(",\n            '" if start else "            '")
+        write_variants_json(f, {name: values[start:start + _DATA_BLOCK_SIZE]
+                                for name, values in columns.items()})
+        f.write("'")
+    f.write("\n        ];\n")
+
+def generate_html(file_path, output_path=None, coverage_metrics_path=None, external_data=False):
+    """
+    Generate HTML report from TSV file. With external_data, the variant data
+    goes into a <report>_data.js file next to the report instead of being
+    embedded, which keeps the HTML small and lets the browser load the data
+    as a separate script (this also works for reports opened from disk).
+    """
+    # Determine output filename if not specified
+    stem = os.path.splitext(file_path)[0]
+    if not output_path:
+        output_path = stem + "_report.html"
+    
+    # Get the sample name from the file path
+    sample_name = os.path.basename(stem).partition('_variants')[0]
+    
+    # Read the TSV file
+    try:
+        headers, variants = read_tsv_file(file_path)
+    except Exception as e:
+        print(f"Error reading TSV file: {e}")
+        return False
+    columns = variant_columns(headers, variants)
+    del variants
+    
+    # Read coverage metrics if available, else try a file with standard naming.
+    # Opening the file is the existence check: a missing file reads as None.
+    coverage_metrics = None
+    if coverage_metrics_path:
+        coverage_metrics = read_coverage_metrics(coverage_metrics_path)
+    if coverage_metrics is None:
+        coverage_metrics = read_coverage_metrics(f"{sample_name}_coverage_metrics.txt")
+    if coverage_metrics is None:
+        print(f"Warning: Coverage metrics file not found. Using default values.")
+        coverage_metrics = {
+            'sample_id': sample_name,
+            'raw_reads': "N/A",
+            'trimmed_reads': "N/A",
+            'mean_read_length': "N/A",
+            'uniquely_mapped_reads': "N/A",
+            'duplicate_reads': "N/A",
+            'average_coverage': "N/A",
+            'bases_10x': "N/A",
+            'bases_30x': "N/A",
+            'bases_50x': "N/A",
+            'bases_100x': "N/A",
+            'bases_200x': "N/A",
+            'bases_300x': "N/A"
+        }
+    
+    # Current date for the report
+    current_date = datetime.now().strftime("%B %d, %Y")
+    
+    # Fill in the per-sample part of the HTML; anything missing shows as N/A
+    context = defaultdict(lambda: 'N/A', coverage_metrics)
+    for key in ('bases_10x', 'bases_30x', 'bases_50x', 'bases_100x', 'bases_200x', 'bases_300x'):
+        context[key + '_width'] = coverage_metrics.get(key, '0%').replace('%', '')
+    context['sample_name'] = sample_name
+    context['current_date'] = current_date
+    sample_html = _SAMPLE_HTML.format_map(context)
+    
+    # Write the HTML file in sections, streaming the variant data in between
+    # so the whole report is never built up as one string in memory
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(_REPORT_HEAD)
+        f.write(sample_html)
+        if external_data:
+            data_path = os.path.splitext(output_path)[0] + "_data.js"
+            with open(data_path, 'w', encoding='utf-8', buffering=1 << 20) as data_file:
+                write_data_script(data_file, columns)
+            f.write(f'    <script src="{quote(os.path.basename(data_path))}"></script>\n')
+        else:
+            f.write('    <script>\n')
+            write_data_script(f, columns)
+            f.write('    </script>\n')
+        f.write(_REPORT_SCRIPT)
     
     print(f"Generated enhanced report: {output_path}")
     return True
 
 def main():
     """Main function to run from the command line"""
-    if len(sys.argv) < 2:
-        print("Usage: python generate_report.py <input_tsv_file> [output_html_file] [coverage_metrics_file]")
+    # --external-data writes the variant data to a separate .js file next to the report
+    args = [arg for arg in sys.argv[1:] if arg != '--external-data']
+    external_data = len(args) < len(sys.argv) - 1
+    
+    if len(args) < 1:
+        print("Usage: python generate_report.py [--external-data] <input_tsv_file> [output_html_file] [coverage_metrics_file]")
         return
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
-    coverage_metrics_file = sys.argv[3] if len(sys.argv) > 3 else None
+    input_file = args[0]
+    output_file = args[1] if len(args) > 1 else None
+    coverage_metrics_file = args[2] if len(args) > 2 else None
     
     if not os.path.exists(input_file):
         print(f"Error: Input file '{input_file}' not found")
         return
     
-    result = generate_html(input_file, output_file, coverage_metrics_file)
+    result = generate_html(input_file, output_file, coverage_metrics_file, external_data)
     if result:
         print("Enhanced report generation completed successfully!")
     else:
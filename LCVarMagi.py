@@ -11,37 +11,31 @@ All other data remains completely unchanged.
 """
 
 import pandas as pd
+import numpy as np
 import re
-from collections import Counter
 import sys
 
+# Criterion types, in the order LCVarSplit.py writes them to ACMG_Rules
+CRITERIA_TYPES = ('PVS', 'PS', 'PM', 'PP', 'BS', 'BP')
+
+# Slot of each criterion type in a parse_acmg_criteria result
+_CRITERIA_SLOTS = {criterion: slot for slot, criterion in enumerate(CRITERIA_TYPES)}
+
+# A criterion type is the prefix of a comma-separated item, e.g. 'PM' in ' PM2'
+_CRITERION_RE = re.compile(r'(?:^|,)\s*(PVS|PS|PM|PP|BS|BP)')
+
 def parse_acmg_criteria(acmg_rules_str):
     """
     Parse ACMG criteria from the ACMG_Rules column
-    Returns a Counter object with counts of each criterion type
+    Returns a list of six counts, one per criterion type in CRITERIA_TYPES order
     """
+    counts = [0] * 6
     if pd.isna(acmg_rules_str) or acmg_rules_str == '' or str(acmg_rules_str) == 'nan':
-        return Counter()
-    
-    # Split by comma and strip whitespace
-    criteria = [c.strip() for c in str(acmg_rules_str).split(',')]
-    
-    # Count different types of criteria
-    counts = Counter()
-    
-    for criterion in criteria:
-        if criterion.startswith('PVS'):
-            counts['PVS'] += 1
-        elif criterion.startswith('PS'):
-            counts['PS'] += 1
-        elif criterion.startswith('PM'):
-            counts['PM'] += 1
-        elif criterion.startswith('PP'):
-            counts['PP'] += 1
-        elif criterion.startswith('BS'):
-            counts['BS'] += 1
-        elif criterion.startswith('BP'):
-            counts['BP'] += 1
+        return counts
+    
+    # Count different types of criteria, found in one scan of the string
+    for criterion in _CRITERION_RE.findall(str(acmg_rules_str)):
+        counts[_CRITERIA_SLOTS[criterion]] += 1
     
     return counts
 
@@ -51,17 +45,12 @@ def classify_vus(criteria_counts):
     Implementation of Table 1 from MAGI-ACMG paper
     
     Args:
-        criteria_counts: Counter object with counts of each criterion type
+        criteria_counts: counts of each criterion type, as from parse_acmg_criteria
         
     Returns:
         str: 'Vus H', 'Vus M', or 'Vus C'
     """
-    pvs = criteria_counts.get('PVS', 0)
-    ps = criteria_counts.get('PS', 0)
-    pm = criteria_counts.get('PM', 0)
-    pp = criteria_counts.get('PP', 0)
-    bs = criteria_counts.get('BS', 0)
-    bp = criteria_counts.get('BP', 0)
+    pvs, ps, pm, pp, bs, bp = criteria_counts
     
     # HOT VUS Classification Rules (from Table 1)
     # These are the exact combinations from the paper's Table 1
@@ -155,6 +144,55 @@ def classify_vus(criteria_counts):
     # Default to COLD for any remaining combinations
     return 'Vus C'
 
+def count_acmg_criteria(acmg_rules):
+    """
+    Vectorized parse_acmg_criteria for a whole Series of ACMG_Rules strings
+    Returns a DataFrame with one count column per criterion type
+    """
+    # Far fewer distinct rule combinations than variants: parse each once.
+    # The extra last row of zeros is what missing values (code -1) pick.
+    codes, distinct_rules = pd.factorize(acmg_rules)
+    counts = np.array([parse_acmg_criteria(rules) for rules in distinct_rules] + [[0] * 6])
+    return pd.DataFrame(counts[codes], index=acmg_rules.index, columns=list(CRITERIA_TYPES))
+
+def classify_vus_counts(counts):
+    """
+    Vectorized classify_vus: the same Table 1 rules as boolean masks
+    over the criterion count columns from count_acmg_criteria
+    
+    Returns:
+        numpy array of 'Vus H', 'Vus M' or 'Vus C'
+    """
+    pvs, ps, pm, pp, bs, bp = (counts[criterion].to_numpy() for criterion in CRITERIA_TYPES)
+    no_strong = (pm == 0) & (ps == 0) & (pvs == 0)
+    
+    hot = (
+        # PVS alone OR PVS + BP OR PVS + PP
+        (pvs >= 1) |
+        # PS alone OR PS + PP OR PS + BP + PP OR PS + BS + PP OR PS + BP
+        ((ps >= 1) & ~((pp == 0) & (bp == 0) & (bs >= 1))) |
+        # PM + PM + PP OR PM + PM + PP + BP OR PM + PM + PP + BS
+        ((pm >= 2) & (pp >= 1)) |
+        # PP + PP + PP + PP, with or without BP
+        ((pp >= 4) & no_strong) |
+        # PP + PP + PP + PM
+        ((pp >= 3) & (pm >= 1) & (ps == 0) & (pvs == 0) & ((bp == 0) | (bs == 0)))
+    )
+    
+    middle = (
+        # BS + PVS OR BS + PS
+        ((bs >= 1) & ((pvs >= 1) | (ps >= 1))) |
+        # PM + PM OR BP + PM + PM
+        ((pm >= 2) & (pp == 0) & (bp <= 1)) |
+        # PP + PM OR PP + PP + PM, with or without BP
+        ((pm == 1) & ((pp == 1) | (pp == 2))) |
+        # PP + PP + PP OR BP + PP + PP + PP
+        ((pp >= 3) & no_strong & (bp <= 1))
+    )
+    
+    # Everything else is COLD
+    return np.select([hot, middle], ['Vus H', 'Vus M'], default='Vus C')
+
 def process_vus_classification(input_file, output_file=None):
     """
     Process the prioritized TSV file and add VUS subclassification
@@ -179,8 +217,13 @@ def process_vus_classification(input_file, output_file=None):
     
     # Filter for VUS variants ONLY
     # Only these will be modified - everything else stays exactly the same
-    vus_mask = df['ACMG'].str.contains('Uncertain significance', na=False, case=False)
-    vus_indices = df[vus_mask].index
+    # The column holds only a handful of distinct classifications, so match
+    # those once and look each variant's result up by its category code
+    acmg_codes, acmg_values = pd.factorize(df['ACMG'])
+    is_vus = acmg_values.str.contains('Uncertain significance', case=False, regex=False)
+    # A trailing False for the code -1 of missing values
+    vus_mask = np.append(is_vus, False)[acmg_codes]
+    vus_indices = df.index[vus_mask]
     
     print(f"VUS variants found: {len(vus_indices)}")
     
@@ -192,25 +235,24 @@ def process_vus_classification(input_file, output_file=None):
     # Add new column for criteria parsing (optional - for analysis)
     df['ACMG_Criteria_Parsed'] = ''
     
-    # Process ONLY the VUS variants - leave everything else untouched
-    classifications = {'Vus H': 0, 'Vus M': 0, 'Vus C': 0}
+    # Process ONLY the VUS variants - leave everything else untouched.
+    # Parse ACMG criteria and classify all VUS variants at once
+    criteria_counts = count_acmg_criteria(df.loc[vus_indices, 'ACMG_Rules'])
+    vus_classes = classify_vus_counts(criteria_counts)
     
-    for idx in vus_indices:
-        # Parse ACMG criteria for this VUS variant
-        criteria_counts = parse_acmg_criteria(df.at[idx, 'ACMG_Rules'])
-        
-        # Classify the VUS according to MAGI-ACMG rules
-        vus_class = classify_vus(criteria_counts)
-        
-        # Update ONLY the ACMG column for this VUS variant
-        # Replace "Uncertain significance" with specific classification
-        df.at[idx, 'ACMG'] = vus_class
-        
-        # Optional: Add criteria parsing for analysis
-        if len(criteria_counts) > 0:
-            df.at[idx, 'ACMG_Criteria_Parsed'] = ', '.join([f"{k}:{v}" for k, v in criteria_counts.items()])
-        
-        classifications[vus_class] += 1
+    # Update ONLY the ACMG column for these VUS variants
+    # Replace "Uncertain significance" with specific classification
+    df.loc[vus_indices, 'ACMG'] = vus_classes
+    
+    # Optional: Add criteria parsing for analysis, e.g. "PM:1, PP:2"
+    parsed = ''
+    for criterion in CRITERIA_TYPES:
+        count = criteria_counts[criterion]
+        parsed = parsed + (criterion + ':' + count.astype(str) + ', ').where(count > 0, '')
+    df.loc[vus_indices, 'ACMG_Criteria_Parsed'] = parsed.str[:-2]
+    
+    classifications = {vus_class: int((vus_classes == vus_class).sum())
+                       for vus_class in ('Vus H', 'Vus M', 'Vus C')}
     
     # Print classification summary
     print("\nVUS Classification Summary:")
@@ -256,7 +298,7 @@ def process_vus_classification(input_file, output_file=None):
     available_cols = [col for col in summary_cols if col in df.columns]
     
     # Get all VUS variants (now classified as Vus H/M/C)
-    vus_results = df[df['ACMG'].isin(['Vus H', 'Vus M', 'Vus C'])][available_cols].copy()
+    vus_results = df.loc[vus_indices, available_cols]
     vus_results.to_csv(vus_summary_file, sep='\t', index=False)
     print(f"VUS summary saved to: {vus_summary_file}")
     
@@ -1,13 +1,16 @@
 import sys
+from operator import itemgetter
 
 def merge_files(intervar_file, snpsift_file, output_matched_file, output_unmatched_file):
-    # Read SnpSift file and create a lookup table
+    # Read SnpSift file and create a lookup table. Both the key (the five
+    # variant fields) and the extracted values are stored tab-joined, so a
+    # lookup hashes one string and a match is written without another join.
     snpsift_variants = {}
     snpsift_cols = ['ANN[0].GENE', 'ANN[0].FEATUREID', 'ANN[0].HGVS_P', 'ANN[0].HGVS_C',
                     'ANN[0].EFFECT', 'ANN[0].IMPACT', 'ANN[0].RANK', 'DP', 'AF',
                     'GEN[0].AD', 'CLNHGVS', 'CLNSIGCONF', 'ALLELEID', 'FILTER', 'RS']
     
-    with open(snpsift_file, 'r') as snpsift:
+    with open(snpsift_file, 'r', buffering=1 << 20) as snpsift:
         # Read header
         header = snpsift.readline().strip().split('\t')
         
@@ -29,32 +32,34 @@ def merge_files(intervar_file, snpsift_file, output_matched_file, output_unmatch
             print(f"Error: Could not find required column in SnpSift file: {e}")
             sys.exit(1)
         
+        # Pick the key and the extracted values out of a row in one call each.
+        # Every row gets an extra empty field at the end, which is what the
+        # index -1 of a missing column then picks.
+        get_key = itemgetter(chr_idx, start_idx, end_idx, ref_idx, alt_idx)
+        get_values = itemgetter(*extract_indices)
+        key_width = max(chr_idx, start_idx, end_idx, ref_idx, alt_idx)
+        values_width = max(extract_indices) + 1
+        
         # Process variants
         for line in snpsift:
             fields = line.strip().split('\t')
-            if len(fields) <= max(chr_idx, start_idx, end_idx, ref_idx, alt_idx):
+            if len(fields) <= key_width:
                 continue  # Skip lines that don't have enough fields
             
-            # Create key
-            key = (fields[chr_idx], fields[start_idx], fields[end_idx], fields[ref_idx], fields[alt_idx])
-            
-            # Extract values
-            values = []
-            for idx in extract_indices:
-                if idx >= 0 and idx < len(fields):
-                    values.append(fields[idx])
-                else:
-                    values.append('')
+            # Columns past the end of a short line are empty
+            if len(fields) < values_width:
+                fields += [''] * (values_width - len(fields))
+            fields.append('')
             
-            snpsift_variants[key] = values
+            snpsift_variants['\t'.join(get_key(fields))] = '\t'.join(get_values(fields))
     
     # Process InterVar file and create merged output
     matched_count = 0
     unmatched_count = 0
     
-    with open(intervar_file, 'r') as intervar, \
-         open(output_matched_file, 'w') as matched_out, \
-         open(output_unmatched_file, 'w') as unmatched_out:
+    with open(intervar_file, 'r', buffering=1 << 20) as intervar, \
+         open(output_matched_file, 'w', buffering=1 << 20) as matched_out, \
+         open(output_unmatched_file, 'w', buffering=1 << 20) as unmatched_out:
         
         # Read header line
         intervar_header = intervar.readline().strip()
@@ -63,24 +68,26 @@ def merge_files(intervar_file, snpsift_file, output_matched_file, output_unmatch
         matched_out.write(intervar_header + '\t' + '\t'.join(snpsift_cols) + '\n')
         unmatched_out.write(intervar_header + '\n')
         
-        # Process variants
+        # Process variants; only the five key fields need splitting off
         for line in intervar:
-            fields = line.strip().split('\t')
+            line = line.strip()
+            fields = line.split('\t', 5)
             if len(fields) < 5:
                 # Not enough fields, consider as unmatched
-                unmatched_out.write(line.strip() + '\n')
+                unmatched_out.write(line + '\n')
                 unmatched_count += 1
                 continue
             
             # Create key
-            key = (fields[0], fields[1], fields[2], fields[3], fields[4])
+            key = '\t'.join(fields[:5])
             
             # Look up in SnpSift data
-            if key in snpsift_variants:
-                matched_out.write(line.strip() + '\t' + '\t'.join(snpsift_variants[key]) + '\n')
+            values = snpsift_variants.get(key)
+            if values is not None:
+                matched_out.write(line + '\t' + values + '\n')
                 matched_count += 1
             else:
-                unmatched_out.write(line.strip() + '\n')
+                unmatched_out.write(line + '\n')
                 unmatched_count += 1
     
     # Print statistics
@@ -11,10 +11,64 @@ Date: 2025
 """
 
 import sys
+import numpy as np
 import pandas as pd
 import re
+from collections import Counter, defaultdict
 from typing import Set, List
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+# Variants read, processed and written at a time
+CHUNK_SIZE = 200_000
+
+# Columns with few distinct values, read as categoricals: the long Orpha
+# annotations repeat for every variant of a gene, and are then held only once
+CATEGORY_COLUMNS = ('Chr', 'Ref.Gene', 'Orpha')
+
+# HTML tags and non-breaking spaces in Orpha inheritance text, both replaced by a space
+_HTML_RE = re.compile(r'<[^>]*>|&nbsp;')
+
+# Separators between inheritance modes; 'or' and 'and' only as whole words,
+# so words such as 'multifactorial' are not cut apart
+_SEPARATOR_RE = re.compile(r'\bor\b|\band\b|/|&')
+
+# Inheritance keywords and their abbreviations, in order of precedence:
+# a part takes the abbreviation of the first keyword it contains
+_INHERITANCE_KEYWORDS = [
+    ('autosomal dominant', 'AD'),
+    ('autosomal recessive', 'AR'),
+    ('x-linked dominant', 'XD'),
+    ('x-linked', 'XR'),
+    ('mitochondrial', 'MT'),
+    ('multigenic', 'MF'),
+    ('multifactorial', 'MF'),
+    ('oligogenic', 'OG'),
+    ('not applicable', 'Unknown'),
+    ('unknown', 'Unknown'),
+    ('-', 'Unknown'),
+]
+
+# Orpha prevalence classes and their scores (higher frequency = more clinically relevant)
+_FREQUENCY_SCORES = {
+    '1-5 / 10 000': 100,
+    '1-9 / 10 000': 100,
+    '1-9 / 100 000': 90,
+    '1-5 / 100 000': 80,
+    '1-9 / 1 000 000': 70,
+    '<1 / 1 000 000': 60,
+    'unknown': 30,
+}
+_FREQUENCY_RE = re.compile('|'.join(map(re.escape, _FREQUENCY_SCORES)))
+
+# Common autosomal patterns, and patterns dropped once one of those is present
+_AUTOSOMAL_PATTERNS = frozenset({'AD', 'AR'})
+_LESS_COMMON_PATTERNS = frozenset({'MF', 'OG', 'MT'})
+
 
 def parse_inheritance_pattern(inheritance_text: str) -> Set[str]:
     """
@@ -32,44 +86,47 @@ def parse_inheritance_pattern(inheritance_text: str) -> Set[str]:
     patterns = set()
     
     # Clean HTML tags and normalize text
-    text = re.sub(r'<[^>]*>', ' ', inheritance_text)
-    text = re.sub(r'&nbsp;', ' ', text)
-    text = text.lower().strip()
+    text = _HTML_RE.sub(' ', inheritance_text).lower().strip()
     
     # Handle common separators and split into parts
-    separators = ['or', 'and', '/', '&']
-    parts = [text]
-    
-    for sep in separators:
-        new_parts = []
-        for part in parts:
-            new_parts.extend(part.split(sep))
-        parts = new_parts
+    parts = _SEPARATOR_RE.split(text)
     
     # Map each part to standard abbreviation
     for part in parts:
-        part = part.strip()
-        
-        if 'autosomal dominant' in part:
-            patterns.add('AD')
-        elif 'autosomal recessive' in part:
-            patterns.add('AR')
-        elif 'x-linked dominant' in part:
-            patterns.add('XD')
-        elif 'x-linked recessive' in part or 'x-linked' in part:
-            patterns.add('XR')
-        elif 'mitochondrial' in part:
-            patterns.add('MT')
-        elif 'multigenic' in part or 'multifactorial' in part:
-            patterns.add('MF')
-        elif 'oligogenic' in part:
-            patterns.add('OG')
-        elif any(keyword in part for keyword in ['not applicable', 'unknown', '-']):
-            patterns.add('Unknown')
+        for keyword, abbreviation in _INHERITANCE_KEYWORDS:
+            if keyword in part:
+                patterns.add(abbreviation)
+                break
     
     return patterns if patterns else {'Unknown'}
 
 
+def priority_score(condition: dict) -> int:
+    """
+    Clinical prioritization score of an Orpha condition.
+    
+    Args:
+        condition: Parsed condition with its 'frequency' and inheritance 'patterns'
+        
+    Returns:
+        Score, higher for more clinically relevant conditions
+    """
+    freq = condition['frequency'].lower()
+    
+    # Frequency-based scoring: the best prevalence class mentioned, found in one scan
+    score = max(map(_FREQUENCY_SCORES.get, _FREQUENCY_RE.findall(freq)), default=0)
+    
+    # Prefer simpler inheritance patterns
+    if len(condition['patterns']) == 1:
+        score += 20
+    
+    # Boost common autosomal patterns
+    if not _AUTOSOMAL_PATTERNS.isdisjoint(condition['patterns']):
+        score += 10
+        
+    return score
+
+
 def extract_inheritance_from_orpha(orpha_data: str) -> str:
     """
     Extract and parse inheritance patterns from Orpha column with clinical prioritization.
@@ -95,10 +152,12 @@ def extract_inheritance_from_orpha(orpha_data: str) -> str:
             frequency = fields[2] if len(fields) > 2 else ''
             inheritance = fields[3] if len(fields) > 3 else ''
             
+            # Most empty slots are bare: skip them before any regex work
+            if inheritance in ('', '-', 'Unknown'):
+                continue
+            
             # Clean HTML tags and normalize spacing
-            inheritance = re.sub(r'<[^>]*>', ' ', inheritance)
-            inheritance = re.sub(r'&nbsp;', ' ', inheritance)
-            inheritance = inheritance.strip()
+            inheritance = _HTML_RE.sub(' ', inheritance).strip()
             
             # Skip conditions with empty, dash, or unknown inheritance
             if inheritance and inheritance not in ['-', '', 'Unknown']:
@@ -106,87 +165,57 @@ def extract_inheritance_from_orpha(orpha_data: str) -> str:
                 # Only keep conditions that have valid inheritance patterns (exclude Unknown)
                 valid_patterns = {p for p in patterns if p != 'Unknown'}
                 if valid_patterns:
-                    conditions.append({
+                    parsed = {
                         'id': condition_id,
                         'name': condition_name,
                         'frequency': frequency,
                         'inheritance': inheritance,
                         'patterns': valid_patterns
-                    })
+                    }
+                    # Scored once here, then reused for sorting and comparing
+                    parsed['score'] = priority_score(parsed)
+                    conditions.append(parsed)
     
     if not conditions:
         return ''
     
-    # Clinical prioritization scoring
-    def priority_score(condition):
-        freq = condition['frequency'].lower()
-        score = 0
-        
-        # Frequency-based scoring (higher frequency = more clinically relevant)
-        if '1-5 / 10 000' in freq or '1-9 / 10 000' in freq:
-            score += 100
-        elif '1-9 / 100 000' in freq:
-            score += 90
-        elif '1-5 / 100 000' in freq:
-            score += 80
-        elif '1-9 / 1 000 000' in freq:
-            score += 70
-        elif '<1 / 1 000 000' in freq:
-            score += 60
-        elif 'unknown' in freq:
-            score += 30
-        
-        # Prefer simpler inheritance patterns
-        if len(condition['patterns']) == 1:
-            score += 20
-        
-        # Boost common autosomal patterns
-        if 'AR' in condition['patterns'] or 'AD' in condition['patterns']:
-            score += 10
-            
-        return score
-    
-    # Sort conditions by clinical priority (highest score first)
-    conditions.sort(key=priority_score, reverse=True)
+    # Only conditions scoring within 25 points of the top are combined, so only
+    # those are put in clinical priority order (highest score first). The sort is
+    # stable: the first condition with the top score leads, as before.
+    top_score = max(condition['score'] for condition in conditions)
+    candidates = [condition for condition in conditions if condition['score'] >= top_score - 25]
+    candidates.sort(key=lambda condition: condition['score'], reverse=True)
     
     # Strategy: Use a more selective approach for combining patterns
     final_patterns = set()
     
-    if conditions:
-        # Start with the highest priority condition
-        top_condition = conditions[0]
-        top_score = priority_score(top_condition)
-        
-        # Add patterns from the top condition
-        final_patterns.update(top_condition['patterns'])
-        
-        # Only add patterns from other conditions if they are very close in score
-        # and contribute clinically relevant patterns
-        for condition in conditions[1:]:
-            current_score = priority_score(condition)
-            
-            # Only consider conditions with scores within 25 points of the top
-            if current_score >= top_score - 25:
-                # Add patterns, but apply clinical filtering during addition
-                for pattern in condition['patterns']:
-                    # Skip X-linked if we already have autosomal patterns
-                    if pattern == 'XR' and ('AD' in final_patterns or 'AR' in final_patterns):
-                        continue
-                    # Skip less common patterns if we already have AD/AR
-                    if pattern in ['MF', 'OG', 'MT'] and ('AD' in final_patterns or 'AR' in final_patterns):
-                        continue
-                    final_patterns.add(pattern)
+    # Start with the highest priority condition
+    top_condition = candidates[0]
+    
+    # Add patterns from the top condition
+    final_patterns.update(top_condition['patterns'])
+    
+    # Only add patterns from the other close conditions if they contribute
+    # clinically relevant patterns
+    for condition in candidates[1:]:
+        # Add patterns, but apply clinical filtering during addition
+        for pattern in condition['patterns']:
+            # Skip X-linked and less common patterns if we already have AD/AR
+            if (pattern == 'XR' or pattern in _LESS_COMMON_PATTERNS) and \
+               not _AUTOSOMAL_PATTERNS.isdisjoint(final_patterns):
+                continue
+            final_patterns.add(pattern)
     
     # Final clinical filtering
     if final_patterns:
         # Rule 1: If we have both autosomal (AD/AR) and X-linked (XR), remove X-linked
-        if ('AD' in final_patterns or 'AR' in final_patterns) and 'XR' in final_patterns:
+        if 'XR' in final_patterns and not _AUTOSOMAL_PATTERNS.isdisjoint(final_patterns):
             final_patterns.discard('XR')
         
         # Rule 2: If we have too many patterns, keep only the most standard ones
         if len(final_patterns) > 2:
             # Prioritize AD and AR over other patterns
-            standard_patterns = final_patterns.intersection({'AD', 'AR'})
+            standard_patterns = final_patterns & _AUTOSOMAL_PATTERNS
             if standard_patterns:
                 final_patterns = standard_patterns
     
@@ -236,6 +265,36 @@ def determine_variant_type(ref: str, alt: str) -> str:
         return 'Complex'
 
 
+def determine_variant_types(ref: pd.Series, alt: pd.Series) -> np.ndarray:
+    """
+    Vectorized determine_variant_type for whole Ref and Alt columns.
+    
+    Args:
+        ref: Reference alleles
+        alt: Alternative alleles
+        
+    Returns:
+        Array of variant type strings
+    """
+    missing = (ref.isna() | alt.isna()).to_numpy()
+    ref, alt = ref.fillna('').astype(str), alt.fillna('').astype(str)
+    ref_len, alt_len = ref.str.len().to_numpy(), alt.str.len().to_numpy()
+    ref_dash, alt_dash = (ref == '-').to_numpy(), (alt == '-').to_numpy()
+    
+    snv = (ref_len == 1) & (alt_len == 1) & ~ref_dash & ~alt_dash
+    pure_insertion = ref_dash & ~alt_dash
+    pure_deletion = ~ref_dash & alt_dash
+    
+    # Pure indels count the inserted or deleted allele, complex ones the length difference
+    deletion = pure_deletion | (~pure_insertion & (ref_len > alt_len))
+    size = np.select([pure_insertion, pure_deletion], [alt_len, ref_len], np.abs(ref_len - alt_len))
+    indel = np.where(deletion, 'Deletion (', 'Insertion (').astype(object) + size.astype(str) + ')'
+    
+    # Same length but different sequences is Complex
+    return np.select([missing, snv, pure_insertion | pure_deletion | (ref_len != alt_len)],
+                     ['Unknown', 'SNV', indel], default='Complex')
+
+
 def calculate_allelic_balance(gen_ad: str, dp: str) -> str:
     """
     Calculate allelic balance from GEN[0].AD and DP columns.
@@ -266,10 +325,109 @@ def calculate_allelic_balance(gen_ad: str, dp: str) -> str:
     return ''
 
 
+def _parse_counts(values: pd.Series) -> np.ndarray:
+    """
+    Parse a column of integer strings the way int() does, once per distinct value.
+    
+    Args:
+        values: Column of count strings
+        
+    Returns:
+        Float array of the counts, NaN where a value is missing or not an integer
+    """
+    codes, distinct = pd.factorize(values)
+    # The extra last slot is what missing values (code -1) pick
+    counts = np.full(len(distinct) + 1, np.nan)
+    for i, value in enumerate(distinct):
+        try:
+            counts[i] = int(value)
+        except (ValueError, TypeError):
+            pass
+    return counts[codes]
+
+
+def calculate_allelic_balances(gen_ad: pd.Series, dp: pd.Series) -> np.ndarray:
+    """
+    Vectorized calculate_allelic_balance for whole GEN[0].AD and DP columns.
+    
+    Args:
+        gen_ad: GEN[0].AD column (format: "ref_count,alt_count")
+        dp: DP column (total depth)
+        
+    Returns:
+        Array of allelic balances as decimal ratios, '' where not computable
+    """
+    # Only AD values with exactly two counts are used. Dropping everything up to
+    # the comma keeps the column in its string dtype, where str.split would
+    # build a Python list per value.
+    alt_counts = gen_ad.str.replace(r'^[^,]*,', '', regex=True).where(gen_ad.str.count(',') == 1)
+    alt_count = _parse_counts(alt_counts)
+    total_depth = _parse_counts(dp)
+    
+    valid = ~np.isnan(alt_count) & (total_depth > 0)
+    balances = np.full(len(valid), '', dtype=object)
+    balances[valid] = np.char.mod('%.2f', alt_count[valid] / total_depth[valid]).tolist()
+    return balances
+
+
+def add_derived_columns(df: pd.DataFrame, inheritance_cache: dict) -> None:
+    """
+    Add the Variant Type, Inheritance and Allelic Balance columns to a block of variants.
+    
+    Args:
+        df: Block of variants, modified in place
+        inheritance_cache: Inheritance per Orpha annotation, shared between blocks
+    """
+    # Optional columns that are absent read as all missing
+    def column(name):
+        return df[name] if name in df.columns else pd.Series(None, index=df.index, dtype=object)
+    
+    df['Variant Type'] = determine_variant_types(column('Ref'), column('Alt'))
+    
+    # Variants of the same gene share their Orpha annotation, so each
+    # distinct one is parsed once per file (missing values, code -1, pick the last '')
+    orpha_codes, distinct_orpha = pd.factorize(column('Orpha'))
+    inheritance = []
+    for orpha in distinct_orpha:
+        if orpha not in inheritance_cache:
+            inheritance_cache[orpha] = extract_inheritance_from_orpha(orpha)
+        inheritance.append(inheritance_cache[orpha])
+    df['Inheritance'] = np.array(inheritance + [''], dtype=object)[orpha_codes]
+    
+    df['Allelic Balance'] = calculate_allelic_balances(column('GEN[0].AD'), column('DP'))
+
+
+def write_block(df: pd.DataFrame, out, header: bool):
+    """
+    Append a processed block to a binary output file as TSV.
+    
+    pyarrow's CSV writer serializes the columns in C++, much faster than
+    to_csv. It refuses unquoted values holding a tab, quote or line break;
+    such blocks, and all blocks when pyarrow is missing, go through pandas.
+    The header is always written by pandas, which leaves plain names unquoted.
+    """
+    if header:
+        df.head(0).to_csv(out, sep='\t', index=False, encoding='utf-8')
+    if pacsv is not None:
+        sink = pa.BufferOutputStream()
+        try:
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), sink,
+                            pacsv.WriteOptions(include_header=False, delimiter='\t', quoting_style='none'))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+        else:
+            out.write(sink.getvalue())
+            return
+    df.to_csv(out, sep='\t', index=False, header=False, encoding='utf-8')
+
+
 def process_genomics_data(input_file: str, output_file: str):
     """
     Process genomics TSV file and add new columns.
     
+    The file is read, processed and written in blocks of CHUNK_SIZE variants,
+    so memory use does not grow with the size of the input.
+    
     Args:
         input_file: Path to input TSV file
         output_file: Path to output TSV file
@@ -277,64 +435,61 @@ def process_genomics_data(input_file: str, output_file: str):
     try:
         # Read TSV file
         print(f"Reading data from {input_file}...")
-        df = pd.read_csv(input_file, sep='\t', dtype=str, low_memory=False)
-        
-        print(f"Original data shape: {df.shape}")
-        print(f"Columns: {list(df.columns)}")
-        
-        # Add new columns
-        print("Processing Variant Type...")
-        df['Variant Type'] = df.apply(
-            lambda row: determine_variant_type(row.get('Ref'), row.get('Alt')), 
-            axis=1
-        )
+        dtype = defaultdict(lambda: str, {col: 'category' for col in CATEGORY_COLUMNS})
+        reader = pd.read_csv(input_file, sep='\t', dtype=dtype, low_memory=False, chunksize=CHUNK_SIZE)
         
-        print("Processing Inheritance...")
-        df['Inheritance'] = df.apply(
-            lambda row: extract_inheritance_from_orpha(row.get('Orpha')), 
-            axis=1
-        )
+        print(f"Writing results to {output_file}...")
+        inheritance_cache = {}
+        variant_counts = Counter()
+        inheritance_counts = Counter()
+        sample = None
+        total_rows = 0
         
-        print("Processing Allelic Balance...")
-        df['Allelic Balance'] = df.apply(
-            lambda row: calculate_allelic_balance(
-                row.get('GEN[0].AD'), 
-                row.get('DP')
-            ), 
-            axis=1
-        )
+        with reader, open(output_file, 'wb', buffering=1 << 20) as out:
+            for chunk in reader:
+                if sample is None:
+                    print(f"Columns: {list(chunk.columns)}")
+                print(f"Processing variants {total_rows + 1}-{total_rows + len(chunk)}...")
+                
+                add_derived_columns(chunk, inheritance_cache)
+                
+                # The header goes in front of the first block only
+                write_block(chunk, out, header=sample is None)
+                
+                # Keep what the summary needs: counts in order of first appearance and the first rows
+                variant_counts.update(chunk['Variant Type'].value_counts(sort=False).to_dict())
+                inheritance = chunk['Inheritance']
+                inheritance_counts.update(inheritance[inheritance != ''].value_counts(sort=False).to_dict())
+                if sample is None:
+                    sample = chunk.head(5)
+                total_rows += len(chunk)
         
         # Display statistics
         print("\n=== PROCESSING RESULTS ===")
         print(f"New columns added: Variant Type, Inheritance, Allelic Balance")
-        print(f"Final data shape: {df.shape}")
+        print(f"Final data shape: {(total_rows, sample.shape[1])}")
         
         # Variant type statistics
         print("\n=== VARIANT TYPE DISTRIBUTION ===")
-        variant_counts = df['Variant Type'].value_counts()
-        for variant, count in variant_counts.items():
+        for variant, count in variant_counts.most_common():
             print(f"  {variant}: {count}")
         
         # Inheritance pattern statistics
         print("\n=== INHERITANCE PATTERN DISTRIBUTION ===")
-        inheritance_counts = df[df['Inheritance'] != '']['Inheritance'].value_counts()
-        for pattern, count in inheritance_counts.head(10).items():
+        for pattern, count in inheritance_counts.most_common(10):
             print(f"  {pattern}: {count}")
         
         # Sample results
         print("\n=== SAMPLE RESULTS (First 5 rows) ===")
         sample_cols = ['Ref.Gene', 'Ref', 'Alt', 'Variant Type', 'Inheritance', 'Allelic Balance']
-        available_cols = [col for col in sample_cols if col in df.columns]
+        available_cols = [col for col in sample_cols if col in sample.columns]
         
-        for idx, row in df.head(5).iterrows():
+        for idx, row in sample.iterrows():
             print(f"\nRow {idx + 1}:")
             for col in available_cols:
                 print(f"  {col}: {row[col]}")
         
-        # Write output file
-        print(f"\nWriting results to {output_file}...")
-        df.to_csv(output_file, sep='\t', index=False)
-        print("Processing completed successfully!")
+        print("\nProcessing completed successfully!")
         
     except FileNotFoundError:
         print(f"Error: Input file '{input_file}' not found.")
@@ -0,0 +1,107 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C kernel for LCVarConv.py: prefixes bare chromosome names
+(digits, X, Y, M, MT) at the start of each record with 'chr'.
+
+Build in place next to LCVarConv.py with:
+    cythonize -i _chrconv.pyx
+LCVarConv.py falls back to its pure-Python paths when this module is not built.
+"""
+
+import os
+from libc.string cimport memchr, memcpy
+
+cdef Py_ssize_t BLOCK_SIZE = 4 << 20
+cdef int NEWLINE = 10
+cdef int TAB = 9
+
+# Dispatch table indexed by the first byte of a record: only records starting
+# with a digit, X, Y or M can hold a bare chromosome name. Everything else
+# (the '#Chr' header, 'chr'-prefixed names, contigs) is copied without
+# searching for the first tab.
+cdef bint LEAD[256]
+for _c in bytearray(b'0123456789XYM'):
+    LEAD[_c] = True
+
+
+cdef inline bint _is_chr_token(const char* p, Py_ssize_t n) noexcept:
+    """Same token set as _CHR_RE in LCVarConv.py"""
+    cdef Py_ssize_t i
+    if n == 1 and (p[0] == b'X' or p[0] == b'Y' or p[0] == b'M'):
+        return True
+    if n == 2 and p[0] == b'M' and p[1] == b'T':
+        return True
+    if n == 0:
+        return False
+    for i in range(n):
+        if p[i] < b'0' or p[i] > b'9':
+            return False
+    return True
+
+
+cdef bytearray _rewrite(bytes data, Py_ssize_t start, Py_ssize_t end):
+    """Rewrite data[start:end], which starts and ends on a record boundary"""
+    # Worst case every record is a bare token and grows by three bytes
+    cdef bytearray out = bytearray(2 * (end - start) + 3)
+    cdef const char* src = data
+    cdef char* dst = out
+    cdef Py_ssize_t pos = start, o = 0, line_len
+    cdef const char* nl
+    cdef const char* tab
+
+    while pos < end:
+        nl = <const char*>memchr(src + pos, NEWLINE, end - pos)
+        line_len = (nl - src) - pos + 1 if nl != NULL else end - pos
+        if LEAD[<unsigned char>src[pos]]:
+            tab = <const char*>memchr(src + pos, TAB, line_len)
+            if tab != NULL and _is_chr_token(src + pos, (tab - src) - pos):
+                memcpy(dst + o, b"chr", 3)
+                o += 3
+        memcpy(dst + o, src + pos, line_len)
+        o += line_len
+        pos += line_len
+
+    del out[o:]
+    return out
+
+
+cdef _write_all(int fd, buf):
+    view = memoryview(buf)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def convert_stream(int fd_in, int fd_out):
+    """
+    Copy fd_in to fd_out in large blocks, rewriting chromosome names.
+    A partial last line is carried over so records are never split. It grows
+    in place and is joined only with the head of the block that ends it, so
+    a line spanning many blocks costs linear time.
+    """
+    cdef bytearray carry = bytearray()
+    cdef bytes chunk, line
+    cdef Py_ssize_t start, end
+
+    while True:
+        chunk = os.read(fd_in, BLOCK_SIZE)
+        if not chunk:
+            break
+        start = 0
+        if carry:
+            # Finish the carried line with the head of this block
+            start = chunk.find(b'\n') + 1
+            if not start:
+                carry += chunk
+                continue
+            carry += chunk[:start]
+            line = bytes(carry)
+            del carry[:]
+            _write_all(fd_out, _rewrite(line, 0, len(line)))
+        end = chunk.rfind(b'\n') + 1
+        if end > start:
+            _write_all(fd_out, _rewrite(chunk, start, end))
+        carry += chunk[max(start, end):]
+
+    if carry:
+        line = bytes(carry)
+        _write_all(fd_out, _rewrite(line, 0, len(line)))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Checks the optional _chrconv kernel against the pure-Python rewrite in
+LCVarConv.py. Skipped when the kernel is not built (cythonize -i _chrconv.pyx).
+
+Run with: python -m pytest test_chrconv.py  (or python -m unittest test_chrconv)
+"""
+
+import io
+import os
+import tempfile
+import unittest
+
+import LCVarConv
+
+try:
+    import _chrconv
+except ImportError:
+    _chrconv = None
+
+# Read size of the kernel, so inputs can straddle block boundaries
+_BLOCK = 4 << 20
+
+
+def _python_rewrite(data):
+    """Reference output: the pure-Python rewrite of the whole input"""
+    out = io.BytesIO()
+    LCVarConv._rewrite(data, out)
+    return out.getvalue()
+
+
+@unittest.skipIf(_chrconv is None, '_chrconv kernel not built')
+class ChrConvKernelTest(unittest.TestCase):
+
+    def convert(self, data):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            in_path = os.path.join(tmp_dir, 'in.tsv')
+            out_path = os.path.join(tmp_dir, 'out.tsv')
+            with open(in_path, 'wb') as f:
+                f.write(data)
+            fd_in = os.open(in_path, os.O_RDONLY)
+            fd_out = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+            try:
+                _chrconv.convert_stream(fd_in, fd_out)
+            finally:
+                os.close(fd_in)
+                os.close(fd_out)
+            with open(out_path, 'rb') as f:
+                return f.read()
+
+    def check(self, data):
+        self.assertEqual(self.convert(data), _python_rewrite(data))
+
+    def test_small_file(self):
+        self.check(b'#Chr\tStart\n1\t10\nchr2\t20\nX\t30\nMT\t40\nGL000220.1\t50\nM\t60\n')
+
+    def test_no_trailing_newline(self):
+        self.check(b'#Chr\tStart\n1\t10\n22\t20')
+
+    def test_empty_and_header_only(self):
+        self.check(b'')
+        self.check(b'#Chr\tStart\n')
+
+    def test_records_across_block_boundaries(self):
+        record = b'17\t123456\tA\tG\tsome annotation\n'
+        self.check(b'#Chr\tStart\n' + record * (3 * _BLOCK // len(record) + 7))
+
+    def test_line_longer_than_several_blocks(self):
+        self.check(b'#Chr\tStart\n1\t' + b'A' * (3 * _BLOCK + 5) + b'\nY\t2\n' + b'2\t' + b'C' * _BLOCK)
+
+
+if __name__ == '__main__':
+    unittest.main()